@@ -6,15 +6,15 @@ to meals from CGM data.
 """
 
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 from dataclasses import dataclass
 
 
 @dataclass
 class SpikeData:
     """Container for glucose spike data"""
-    timestamps: List[float]  # Minutes from meal time
-    glucose: List[float]     # mg/dL
+    timestamps: Union[List[float], np.ndarray]  # Minutes from meal time
+    glucose: Union[List[float], np.ndarray]     # mg/dL
     baseline: float          # Baseline glucose level (mg/dL)
     peak: float             # Peak glucose level (mg/dL)
     meal_time: str          # ISO format timestamp
@@ -54,6 +54,26 @@ def calculate_auc_trapezoidal(x: np.ndarray, y: np.ndarray, baseline: float = 0.
     return auc
 
 
+def _auc_above_baselines(x: np.ndarray, y: np.ndarray, baselines: np.ndarray) -> np.ndarray:
+    """
+    Calculate trapezoidal AUC above several baselines in one vectorized pass.
+    
+    Equivalent to calling calculate_auc_trapezoidal() once per baseline,
+    but the time deltas are computed once and shared across all baselines.
+    
+    Args:
+        x: Time points (minutes)
+        y: Glucose values (mg/dL)
+        baselines: Baseline values to subtract
+    
+    Returns:
+        Array of AUC values, one per baseline (mg/dL * minutes)
+    """
+    y_adjusted = np.maximum(y[np.newaxis, :] - baselines[:, np.newaxis], 0)
+    dx = np.diff(x)
+    return ((y_adjusted[:, 1:] + y_adjusted[:, :-1]) * dx).sum(axis=1) / 2
+
+
 def find_baseline(glucose: np.ndarray, pre_meal_window: int = 3) -> float:
     """
     Determine baseline glucose from pre-meal readings.
@@ -107,9 +127,9 @@ def find_recovery_time(timestamps: np.ndarray, glucose: np.ndarray,
     peak_idx = np.argmax(glucose)
     
     # Search after peak for return to baseline
-    for i in range(peak_idx + 1, len(glucose)):
-        if glucose[i] <= baseline + tolerance:
-            return timestamps[i]
+    recovered = np.flatnonzero(glucose[peak_idx + 1:] <= baseline + tolerance)
+    if len(recovered) > 0:
+        return timestamps[peak_idx + 1 + recovered[0]]
     
     return None
 
@@ -153,15 +173,15 @@ def analyze_spike(spike_data: SpikeData) -> AUCResults:
     Returns:
         AUCResults object with all calculated metrics
     """
-    timestamps = np.array(spike_data.timestamps)
-    glucose = np.array(spike_data.glucose)
+    timestamps = np.asarray(spike_data.timestamps, dtype=float)
+    glucose = np.asarray(spike_data.glucose, dtype=float)
     baseline = spike_data.baseline
     peak = spike_data.peak
     
-    # Calculate different AUC methods
-    auc_0 = calculate_auc_trapezoidal(timestamps, glucose, baseline=0)
-    auc_70 = calculate_auc_trapezoidal(timestamps, glucose, baseline=70)
-    auc_relative = calculate_auc_trapezoidal(timestamps, glucose, baseline=baseline)
+    # Calculate different AUC methods (absolute, fasting, relative) in one pass
+    auc_0, auc_70, auc_relative = _auc_above_baselines(
+        timestamps, glucose, np.array([0.0, 70.0, baseline])
+    )
     
     # Calculate normalized AUC for shape comparison
     normalized_auc = calculate_normalized_auc(timestamps, glucose, baseline, peak)
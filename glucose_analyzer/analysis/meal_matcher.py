@@ -4,7 +4,9 @@ Associates detected glucose spikes with logged meals
 Supports multiple meals per spike
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+from glucose_analyzer.utils.timestamps import parse_timestamp
 
 
 class MealSpikeMatch:
@@ -16,6 +18,7 @@ class MealSpikeMatch:
         self.total_gl = 0  # Sum of GL from all associated meals
         self.meal_count = 0  # Number of meals
         self.meal_delays = []  # Time from each meal to spike start (minutes)
+        self.earliest_delay = 0  # Smallest meal delay, 0 when no meals
         self.is_complex = False  # DEPRECATED: All multi-meal spikes are complex
     
     def __repr__(self):
@@ -25,6 +28,12 @@ class MealSpikeMatch:
                     f"spike_start={self.spike.start_time})")
         return "MealSpikeMatch(unmatched)"
     
+    def __setstate__(self, state):
+        """Restore a pickled match, filling in earliest_delay for older pickles"""
+        self.__dict__.update(state)
+        if 'earliest_delay' not in state:
+            self.earliest_delay = min(self.meal_delays) if self.meal_delays else 0
+    
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
         return {
@@ -37,6 +46,69 @@ class MealSpikeMatch:
         }
 
 
+class MatchStatsAccumulator:
+    """Running totals for match statistics, updated one match at a time"""
+    
+    def __init__(self):
+        """Initialize empty accumulator"""
+        self.matched_count = 0
+        self.complex_events = 0
+        self.sum_gl = 0.0
+        self.sum_magnitude = 0.0
+        self.magnitude_count = 0
+        self.sum_delay = 0.0
+        self.min_delay = float('inf')
+        self.max_delay = float('-inf')
+        self.delay_count = 0
+    
+    def add(self, meal_count, total_gl, magnitude=None, earliest_delay=None):
+        """
+        Add a matched event to the running totals
+        
+        Args:
+            meal_count: Number of contributing meals
+            total_gl: Total GL of contributing meals
+            magnitude: Spike magnitude, if a spike is attached
+            earliest_delay: Delay from earliest meal to spike start, if known
+        """
+        self.matched_count += 1
+        if meal_count > 1:
+            self.complex_events += 1
+        self.sum_gl += total_gl
+        if magnitude is not None:
+            self.sum_magnitude += magnitude
+            self.magnitude_count += 1
+        if earliest_delay is not None:
+            self.sum_delay += earliest_delay
+            self.min_delay = min(self.min_delay, earliest_delay)
+            self.max_delay = max(self.max_delay, earliest_delay)
+            self.delay_count += 1
+    
+    def result(self, unmatched_spikes_count, unmatched_meals_count):
+        """
+        Get statistics for all matches added so far
+        
+        Args:
+            unmatched_spikes_count: Number of spikes without meals
+            unmatched_meals_count: Number of meals without spikes
+            
+        Returns:
+            dict: Statistics
+        """
+        has_delays = self.delay_count > 0
+        return {
+            'matched_count': self.matched_count,
+            'unmatched_spikes': unmatched_spikes_count,
+            'unmatched_meals': unmatched_meals_count,
+            'complex_events': self.complex_events,
+            'avg_delay': self.sum_delay / self.delay_count if has_delays else 0,
+            'min_delay': self.min_delay if has_delays else 0,
+            'max_delay': self.max_delay if has_delays else 0,
+            'avg_gl': self.sum_gl / self.matched_count if self.matched_count else 0,
+            'avg_magnitude': self.sum_magnitude / self.magnitude_count if self.magnitude_count else 0
+        }
+
+
 class MealMatcher:
     """Matches meals to glucose spikes with multi-meal support"""
     
@@ -49,6 +121,8 @@ class MealMatcher:
         """
         self.config = config
         self.pre_spike_meal_window = config.get('spike_detection', 'pre_spike_meal_window')
+        # Statistics dict (as from get_stats()) gathered by the last match_meals_to_spikes call
+        self.last_stats = None
     
     def match_meals_to_spikes(self, meals, spikes):
         """
@@ -65,15 +139,17 @@ class MealMatcher:
                 'unmatched_spikes': list of SpikeEvent objects,
                 'unmatched_meals': list of meal dicts
             }
+            Statistics of the matches are left in last_stats.
         """
         matched = []
         unmatched_spikes = []
+        stats = MatchStatsAccumulator()
         
         # Convert meal timestamps to datetime objects
         meals_with_dt = []
         for meal in meals:
             meal_copy = meal.copy()
-            meal_copy['datetime'] = datetime.strptime(meal['timestamp'], "%Y-%m-%d:%H:%M")
+            meal_copy['datetime'] = parse_timestamp(meal['timestamp'])
             meals_with_dt.append(meal_copy)
         
         # Sort meals by time
@@ -102,7 +178,11 @@ class MealMatcher:
                     match.meal_delays.append(delay)
                     matched_meal_timestamps.add(meal['timestamp'])
                 
+                match.earliest_delay = min(match.meal_delays)
+                
                 matched.append(match)
+                stats.add(match.meal_count, match.total_gl, spike.magnitude,
+                          match.earliest_delay)
             else:
                 # Spike with no associated meals
                 unmatched_spikes.append(spike)
@@ -110,11 +190,14 @@ class MealMatcher:
         # Create unmatched meals list
         unmatched_meals = [m for m in meals if m['timestamp'] not in matched_meal_timestamps]
         
-        return {
+        match_results = {
             'matched': matched,
             'unmatched_spikes': unmatched_spikes,
             'unmatched_meals': unmatched_meals
         }
+        
+        self.last_stats = stats.result(len(unmatched_spikes), len(unmatched_meals))
+        return match_results
     
     def _find_meals_for_spike(self, spike, meals_with_dt):
         """
@@ -165,61 +248,31 @@ class MealMatcher:
         unmatched_spikes = match_results.get('unmatched_spikes', [])
         unmatched_meals = match_results.get('unmatched_meals', [])
         
-        if not matched:
-            return {
-                'matched_count': 0,
-                'unmatched_spikes': len(unmatched_spikes),
-                'unmatched_meals': len(unmatched_meals),
-                'complex_events': 0,
-                'avg_delay': 0,
-                'min_delay': 0,
-                'max_delay': 0,
-                'avg_gl': 0,
-                'avg_magnitude': 0
-            }
-        
         # Helper function to safely get attribute from object or dict
         def get_val(item, attr):
             if isinstance(item, dict):
                 return item.get(attr)
             return getattr(item, attr, None)
         
-        # Count multi-meal spikes (complex events)
-        multi_meal = sum(1 for m in matched if (get_val(m, 'meal_count') or 0) > 1)
-        
-        # Extract values with None handling
-        total_gl_values = [get_val(m, 'total_gl') or 0 for m in matched]
-        
-        # Handle magnitude - might be in spike object or dict
-        magnitudes = []
+        stats = MatchStatsAccumulator()
         for m in matched:
+            # Handle magnitude - might be in spike object or dict
             spike = get_val(m, 'spike')
+            magnitude = None
             if spike:
                 if isinstance(spike, dict):
-                    magnitudes.append(spike.get('magnitude', 0))
+                    magnitude = spike.get('magnitude', 0)
                 else:
-                    magnitudes.append(getattr(spike, 'magnitude', 0))
-        
-        # Get earliest meal delay for each spike
-        earliest_delays = []
-        for m in matched:
+                    magnitude = getattr(spike, 'magnitude', 0)
+            
+            # Get earliest meal delay for the spike
             delays = get_val(m, 'meal_delays')
-            if delays and len(delays) > 0:
-                earliest_delays.append(min(delays))
-        
-        stats = {
-            'matched_count': len(matched),
-            'unmatched_spikes': len(unmatched_spikes),
-            'unmatched_meals': len(unmatched_meals),
-            'complex_events': multi_meal,
-            'avg_delay': sum(earliest_delays) / len(earliest_delays) if earliest_delays else 0,
-            'min_delay': min(earliest_delays) if earliest_delays else 0,
-            'max_delay': max(earliest_delays) if earliest_delays else 0,
-            'avg_gl': sum(total_gl_values) / len(total_gl_values) if total_gl_values else 0,
-            'avg_magnitude': sum(magnitudes) / len(magnitudes) if magnitudes else 0
-        }
+            earliest_delay = min(delays) if delays else None
+            
+            stats.add(get_val(m, 'meal_count') or 0, get_val(m, 'total_gl') or 0,
+                      magnitude, earliest_delay)
         
-        return stats
+        return stats.result(len(unmatched_spikes), len(unmatched_meals))
     
     def get_unmatched_spike_summary(self, unmatched_spikes):
         """
@@ -9,6 +9,27 @@ from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 
+# Scalar profile fields gathered into one structured array for vectorized stats
+PROFILE_COLUMNS_DTYPE = [('duration', 'f8'), ('magnitude', 'f8'), ('gl', 'f8')]
+
+
+def profile_columns(profiles) -> np.ndarray:
+    """
+    Gather per-profile scalars into a structured array in one pass
+    
+    Args:
+        profiles: List of NormalizedProfile objects
+        
+    Returns:
+        np.ndarray: Fields 'duration', 'magnitude' and 'gl' (NaN when GL is unknown)
+    """
+    return np.fromiter(
+        ((p.duration_minutes, p.original_magnitude,
+          np.nan if p.glycemic_load is None else p.glycemic_load) for p in profiles),
+        dtype=PROFILE_COLUMNS_DTYPE, count=len(profiles)
+    )
+
+
 @dataclass
 class NormalizedProfile:
     """Normalized spike profile for comparison"""
@@ -135,21 +156,25 @@ class SpikeNormalizer:
         if not profiles:
             return {}
         
+        columns = profile_columns(profiles)
+        duration = columns['duration']
+        magnitude = columns['magnitude']
+        
         stats = {
             'count': len(profiles),
-            'avg_duration': np.mean([p.duration_minutes for p in profiles]),
-            'std_duration': np.std([p.duration_minutes for p in profiles]),
-            'min_duration': min([p.duration_minutes for p in profiles]),
-            'max_duration': max([p.duration_minutes for p in profiles]),
-            'avg_magnitude': np.mean([p.original_magnitude for p in profiles]),
-            'std_magnitude': np.std([p.original_magnitude for p in profiles]),
+            'avg_duration': np.mean(duration),
+            'std_duration': np.std(duration),
+            'min_duration': float(duration.min()),
+            'max_duration': float(duration.max()),
+            'avg_magnitude': np.mean(magnitude),
+            'std_magnitude': np.std(magnitude),
         }
         
         # If GL values available, add GL stats
-        profiles_with_gl = [p for p in profiles if p.glycemic_load is not None]
-        if profiles_with_gl:
-            stats['avg_gl'] = np.mean([p.glycemic_load for p in profiles_with_gl])
-            stats['std_gl'] = np.std([p.glycemic_load for p in profiles_with_gl])
+        gl = columns['gl'][~np.isnan(columns['gl'])]
+        if gl.size:
+            stats['avg_gl'] = np.mean(gl)
+            stats['std_gl'] = np.std(gl)
         
         return stats
     
@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 from datetime import timedelta
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 # Import AUC calculator
@@ -14,6 +15,28 @@ import sys
 sys.path.insert(0, '/home/claude')
 from glucose_analyzer.analysis.auc_calculator import SpikeData, analyze_spike, AUCResults
 
+# Readings examined per vectorized step when scanning forward (one day of 5-minute data)
+SCAN_BLOCK = 288
+
+
+def _first_at_or_above(values, level, start):
+    """
+    Find the first value at or above a level, scanning forward in blocks
+    
+    Args:
+        values: Array of values
+        level: Level to reach
+        start: Index to start scanning from
+    
+    Returns:
+        int: Index of the first value >= level, or None if there is none
+    """
+    for lo in range(start, len(values), SCAN_BLOCK):
+        hits = np.flatnonzero(values[lo:lo + SCAN_BLOCK] >= level)
+        if hits.size:
+            return lo + int(hits[0])
+    return None
+
 
 @dataclass
 class Spike:
@@ -37,6 +60,24 @@ class Spike:
     baseline: float = 0.0
     recovery_time: Optional[float] = None  # Minutes from meal to return to baseline
     
+    # Display strings, formatted on first use and reused by every report
+    
+    @cached_property
+    def start_str(self) -> str:
+        """Start time as YYYY-MM-DD HH:MM"""
+        t = self.start_time
+        return f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}"
+    
+    @cached_property
+    def peak_hm(self) -> str:
+        """Peak time as HH:MM"""
+        return f"{self.peak_time.hour:02d}:{self.peak_time.minute:02d}"
+    
+    @cached_property
+    def end_hm(self) -> str:
+        """End time as HH:MM"""
+        return f"{self.end_time.hour:02d}:{self.end_time.minute:02d}"
+    
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
         return {
@@ -59,6 +100,74 @@ class Spike:
         }
 
 
+class SpikeStatsAccumulator:
+    """Running totals for spike statistics, updated one spike at a time"""
+    
+    def __init__(self):
+        """Initialize empty accumulator"""
+        self.count = 0
+        self.sum_magnitude = 0.0
+        self.max_magnitude = float('-inf')
+        self.sum_duration = 0.0
+        self.sum_time_to_peak = 0.0
+        self.sum_auc_70 = 0.0
+        self.sum_auc_relative = 0.0
+        self.sum_normalized_auc = 0.0
+        self.sum_recovery_time = 0.0
+        self.recovery_count = 0
+    
+    def add(self, spike):
+        """
+        Add a spike to the running totals
+        
+        Args:
+            spike: Spike object
+        """
+        self.count += 1
+        self.sum_magnitude += spike.magnitude
+        self.max_magnitude = max(self.max_magnitude, spike.magnitude)
+        self.sum_duration += spike.duration_minutes
+        self.sum_time_to_peak += spike.time_to_peak_minutes
+        self.sum_auc_70 += spike.auc_70
+        self.sum_auc_relative += spike.auc_relative
+        self.sum_normalized_auc += spike.normalized_auc
+        if spike.recovery_time:
+            self.sum_recovery_time += spike.recovery_time
+            self.recovery_count += 1
+    
+    def result(self):
+        """
+        Get statistics for all spikes added so far
+        
+        Returns:
+            dict: Statistics summary
+        """
+        if not self.count:
+            return {
+                'count': 0,
+                'avg_magnitude': 0,
+                'avg_duration': 0,
+                'avg_time_to_peak': 0,
+                'avg_auc_70': 0,
+                'avg_auc_relative': 0,
+                'avg_normalized_auc': 0
+            }
+        
+        n = self.count
+        return {
+            'count': n,
+            'avg_magnitude': self.sum_magnitude / n,
+            'max_magnitude': self.max_magnitude,
+            'avg_duration': self.sum_duration / n,
+            'avg_time_to_peak': self.sum_time_to_peak / n,
+            'avg_auc_70': self.sum_auc_70 / n,
+            'avg_auc_relative': self.sum_auc_relative / n,
+            'avg_normalized_auc': self.sum_normalized_auc / n,
+            'avg_recovery_time': (self.sum_recovery_time / self.recovery_count
+                                  if self.recovery_count else float('nan'))
+        }
+
+
 class SpikeDetector:
     """Detects glucose spike events in CGM data"""
     
@@ -77,6 +186,8 @@ class SpikeDetector:
         self.end_return_threshold = config.get('spike_detection', 'end_criteria', 'return_tolerance')
         self.end_rate_threshold = config.get('spike_detection', 'end_criteria', 'flat_rate_threshold')
         self.end_timeout_minutes = config.get('spike_detection', 'end_criteria', 'max_duration_minutes')
+        # Statistics dict (as from get_stats()) gathered by the last detect_spikes call
+        self.last_stats = None
     
     def detect_spikes(self, cgm_data):
         """
@@ -86,123 +197,140 @@ class SpikeDetector:
             cgm_data: DataFrame with columns ['timestamp', 'glucose']
         
         Returns:
-            list: List of Spike objects
+            List of Spike objects; their statistics are left in last_stats
         """
+        stats = SpikeStatsAccumulator()
+        
         if cgm_data.empty:
+            self.last_stats = stats.result()
             return []
         
+        # Scan plain arrays instead of per-row DataFrame lookups
+        glucose = cgm_data['glucose'].to_numpy(dtype=float)
+        timestamps = cgm_data['timestamp'].array
+        times_ns = cgm_data['timestamp'].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        
         spikes = []
         i = 0
         
         while i < len(cgm_data) - 1:
-            spike = self._detect_single_spike(cgm_data, i)
+            spike = self._detect_single_spike(glucose, timestamps, times_ns, i)
             if spike:
                 # Calculate comprehensive AUC metrics
                 spike = self._calculate_spike_auc(spike, cgm_data)
                 spikes.append(spike)
+                stats.add(spike)
                 # Skip past this spike
                 i = cgm_data[cgm_data['timestamp'] >= spike.end_time].index[0]
             else:
                 i += 1
         
+        self.last_stats = stats.result()
         return spikes
     
-    def _detect_single_spike(self, cgm_data, start_idx):
+    def _detect_single_spike(self, glucose, timestamps, times_ns, start_idx):
         """
         Detect a single spike starting from given index
         
         Args:
-            cgm_data: DataFrame with CGM data
+            glucose: Array of glucose values
+            timestamps: Array of reading timestamps
+            times_ns: Reading timestamps as int64 nanoseconds
             start_idx: Index to start searching from
         
         Returns:
             Spike object or None if no spike detected
         """
-        start_time = cgm_data.iloc[start_idx]['timestamp']
-        start_glucose = cgm_data.iloc[start_idx]['glucose']
+        start_time = timestamps[start_idx]
+        start_glucose = glucose[start_idx]
         
-        # Look for peak
-        peak_idx = start_idx
-        peak_glucose = start_glucose
+        # The running peak only rises, so the first reading that reaches the
+        # magnitude or absolute threshold is where a significant rise is found
+        if start_glucose >= self.min_spike_threshold:
+            found_idx = start_idx + 1 if start_idx + 1 < len(glucose) else None
+        elif np.isnan(start_glucose):
+            found_idx = None
+        else:
+            rise_level = min(start_glucose + self.min_spike_magnitude, self.min_spike_threshold)
+            found_idx = _first_at_or_above(glucose, rise_level, start_idx + 1)
         
-        for i in range(start_idx + 1, len(cgm_data)):
-            current_glucose = cgm_data.iloc[i]['glucose']
-            
-            # Track peak
-            if current_glucose > peak_glucose:
-                peak_idx = i
-                peak_glucose = current_glucose
-            
-            # Check if we've found a spike (sufficient rise)
-            magnitude = peak_glucose - start_glucose
-            
-            if magnitude >= self.min_spike_magnitude or peak_glucose >= self.min_spike_threshold:
-                # Found significant rise, now look for end
-                end_idx, end_reason = self._find_spike_end(cgm_data, start_idx, peak_idx)
-                
-                if end_idx:
-                    peak_time = cgm_data.iloc[peak_idx]['timestamp']
-                    end_time = cgm_data.iloc[end_idx]['timestamp']
-                    end_glucose = cgm_data.iloc[end_idx]['glucose']
-                    
-                    duration = (end_time - start_time).total_seconds() / 60
-                    time_to_peak = (peak_time - start_time).total_seconds() / 60
-                    
-                    return Spike(
-                        start_time=start_time,
-                        start_glucose=start_glucose,
-                        peak_time=peak_time,
-                        peak_glucose=peak_glucose,
-                        end_time=end_time,
-                        end_glucose=end_glucose,
-                        duration_minutes=duration,
-                        time_to_peak_minutes=time_to_peak,
-                        magnitude=magnitude,
-                        end_reason=end_reason,
-                        baseline=start_glucose  # Initial baseline
-                    )
-        
-        return None
+        if found_idx is None:
+            return None
+        
+        # Peak so far (earliest occurrence of the highest reading)
+        peak_idx = start_idx + int(np.nanargmax(glucose[start_idx:found_idx + 1]))
+        peak_glucose = glucose[peak_idx]
+        magnitude = peak_glucose - start_glucose
+        
+        # Found significant rise, now look for end
+        end_idx, end_reason = self._find_spike_end(glucose, times_ns, start_idx, peak_idx)
+        
+        peak_time = timestamps[peak_idx]
+        end_time = timestamps[end_idx]
+        end_glucose = glucose[end_idx]
+        
+        duration = (end_time - start_time).total_seconds() / 60
+        time_to_peak = (peak_time - start_time).total_seconds() / 60
+        
+        return Spike(
+            start_time=start_time,
+            start_glucose=start_glucose,
+            peak_time=peak_time,
+            peak_glucose=peak_glucose,
+            end_time=end_time,
+            end_glucose=end_glucose,
+            duration_minutes=duration,
+            time_to_peak_minutes=time_to_peak,
+            magnitude=magnitude,
+            end_reason=end_reason,
+            baseline=start_glucose  # Initial baseline
+        )
     
-    def _find_spike_end(self, cgm_data, start_idx, peak_idx):
+    def _find_spike_end(self, glucose, times_ns, start_idx, peak_idx):
         """
         Find where the spike ends after reaching peak
         
         Args:
-            cgm_data: DataFrame with CGM data
+            glucose: Array of glucose values
+            times_ns: Reading timestamps as int64 nanoseconds
             start_idx: Index where spike started
             peak_idx: Index of peak glucose
         
         Returns:
-            tuple: (end_index, end_reason) or (None, None)
+            tuple: (end_index, end_reason)
         """
-        start_glucose = cgm_data.iloc[start_idx]['glucose']
-        peak_glucose = cgm_data.iloc[peak_idx]['glucose']
-        peak_time = cgm_data.iloc[peak_idx]['timestamp']
-        
-        # Search for end after peak
-        for i in range(peak_idx + 1, len(cgm_data)):
-            current_glucose = cgm_data.iloc[i]['glucose']
-            current_time = cgm_data.iloc[i]['timestamp']
+        start_glucose = glucose[start_idx]
+        peak_ns = times_ns[peak_idx]
+        
+        # Search for end after peak, one block of readings at a time
+        for lo in range(peak_idx + 1, len(glucose), SCAN_BLOCK):
+            hi = min(lo + SCAN_BLOCK, len(glucose))
+            current = glucose[lo:hi]
+            idx = np.arange(lo, hi)
             
             # End criterion 1: Return to baseline
-            if abs(current_glucose - start_glucose) <= self.end_return_threshold:
-                return i, "returned_to_baseline"
+            returned = np.abs(current - start_glucose) <= self.end_return_threshold
             
             # End criterion 2: Rate flattened (check change over last 3 readings)
-            if i >= peak_idx + 3:
-                recent_values = cgm_data.iloc[i-2:i+1]['glucose'].values
-                rate_of_change = abs(recent_values[-1] - recent_values[0]) / 10  # per minute
-                if rate_of_change <= self.end_rate_threshold:
-                    return i, "rate_flattened"
+            two_back = glucose[np.maximum(idx - 2, 0)]
+            rate_of_change = np.abs(current - two_back) / 10  # per minute
+            flattened = (idx >= peak_idx + 3) & (rate_of_change <= self.end_rate_threshold)
             
             # End criterion 3: Timeout
-            elapsed = (current_time - peak_time).total_seconds() / 60
-            if elapsed >= self.end_timeout_minutes:
-                return i, "timeout"
+            elapsed = (times_ns[lo:hi] - peak_ns) / 1e9 / 60
+            timed_out = elapsed >= self.end_timeout_minutes
+            
+            hits = np.flatnonzero(returned | flattened | timed_out)
+            if hits.size:
+                k = int(hits[0])
+                if returned[k]:
+                    return lo + k, "returned_to_baseline"
+                if flattened[k]:
+                    return lo + k, "rate_flattened"
+                return lo + k, "timeout"
         
         # If we reach end of data, use last point
-        return len(cgm_data) - 1, "end_of_data"
+        return len(glucose) - 1, "end_of_data"
     
     def _calculate_spike_auc(self, spike, cgm_data):
         """
@@ -232,8 +360,8 @@ class SpikeDetector:
         
         # Create SpikeData object for auc_calculator
         spike_data = SpikeData(
-            timestamps=spike_window['minutes_from_start'].tolist(),
-            glucose=spike_window['glucose'].tolist(),
+            timestamps=spike_window['minutes_from_start'].to_numpy(),
+            glucose=spike_window['glucose'].to_numpy(),
             baseline=spike.baseline,
             peak=spike.peak_glucose,
             meal_time=spike.start_time.isoformat(),
@@ -262,25 +390,7 @@ class SpikeDetector:
         Returns:
             dict: Statistics summary
         """
-        if not spikes:
-            return {
-                'count': 0,
-                'avg_magnitude': 0,
-                'avg_duration': 0,
-                'avg_time_to_peak': 0,
-                'avg_auc_70': 0,
-                'avg_auc_relative': 0,
-                'avg_normalized_auc': 0
-            }
-        
-        return {
-            'count': len(spikes),
-            'avg_magnitude': np.mean([s.magnitude for s in spikes]),
-            'max_magnitude': max([s.magnitude for s in spikes]),
-            'avg_duration': np.mean([s.duration_minutes for s in spikes]),
-            'avg_time_to_peak': np.mean([s.time_to_peak_minutes for s in spikes]),
-            'avg_auc_70': np.mean([s.auc_70 for s in spikes]),
-            'avg_auc_relative': np.mean([s.auc_relative for s in spikes]),
-            'avg_normalized_auc': np.mean([s.normalized_auc for s in spikes]),
-            'avg_recovery_time': np.mean([s.recovery_time for s in spikes if s.recovery_time])
-        }
\ No newline at end of file
+        stats = SpikeStatsAccumulator()
+        for spike in spikes:
+            stats.add(spike)
+        return stats.result()
\ No newline at end of file
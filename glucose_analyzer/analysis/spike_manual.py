@@ -1,12 +1,18 @@
 """Manual spike definition using interactive matplotlib charts"""
 
 import json
-import matplotlib.pyplot as plt
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import List, Dict, Optional
 import numpy as np
 
+# Faster decoder for the manual spike catalog when orjson is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 class SpikeEditor:
     """Interactive spike definition using matplotlib click events"""
@@ -37,10 +43,22 @@ class SpikeEditor:
                 all_spikes = json.load(f)
                 target_date = datetime.strptime(self.date_str, '%Y-%m-%d').date()
                 for spike in all_spikes:
-                    start_dt = datetime.fromisoformat(spike['start'])
-                    if start_dt.date() == target_date:
+                    self._annotate_spike(spike)
+                    if spike['_start_dt'].date() == target_date:
                         self.existing_spikes.append(spike)
     
+    @staticmethod
+    def _annotate_spike(spike: Dict) -> Dict:
+        """Parse ISO start/end once and cache the datetimes on the spike dict"""
+        spike['_start_dt'] = datetime.fromisoformat(spike['start'])
+        spike['_end_dt'] = datetime.fromisoformat(spike['end'])
+        return spike
+    
+    @staticmethod
+    def _strip_spike(spike: Dict) -> Dict:
+        """Return spike dict without the cached datetime fields"""
+        return {k: v for k, v in spike.items() if not k.startswith('_')}
+    
     def _load_day_data(self):
         """Load glucose data for the specified day"""
         from glucose_analyzer.parsers.csv_parser import LibreViewParser        
@@ -69,12 +87,9 @@ class SpikeEditor:
     
     def _check_overlap(self, start: datetime, end: datetime) -> Optional[Dict]:
         """Check if new spike overlaps with any existing spike"""
-        for spike in self.existing_spikes + self.new_spikes:
-            spike_start = datetime.fromisoformat(spike['start'])
-            spike_end = datetime.fromisoformat(spike['end'])
-            
+        for spike in chain(self.existing_spikes, self.new_spikes):
             # Check for any overlap or touching boundaries
-            if start < spike_end and end > spike_start:
+            if start < spike['_end_dt'] and end > spike['_start_dt']:
                 return spike
         return None
     
@@ -116,8 +131,8 @@ class SpikeEditor:
             # Check for overlaps
             overlap = self._check_overlap(self.temp_start, end_time)
             if overlap:
-                overlap_start = datetime.fromisoformat(overlap['start']).strftime('%H:%M')
-                overlap_end = datetime.fromisoformat(overlap['end']).strftime('%H:%M')
+                overlap_start = overlap['_start_dt'].strftime('%H:%M')
+                overlap_end = overlap['_end_dt'].strftime('%H:%M')
                 self.ax.set_title(
                     f'OVERLAP with spike [{overlap_start}-{overlap_end}]. '
                     f'Click START for new spike.'
@@ -132,7 +147,9 @@ class SpikeEditor:
             # Valid spike - add it
             new_spike = {
                 'start': self.temp_start.isoformat(),
-                'end': end_time.isoformat()
+                'end': end_time.isoformat(),
+                '_start_dt': self.temp_start,
+                '_end_dt': end_time
             }
             self.new_spikes.append(new_spike)
             
@@ -163,8 +180,8 @@ class SpikeEditor:
     def _draw_existing_spikes(self):
         """Draw existing spikes as shaded regions"""
         for spike in self.existing_spikes:
-            start = datetime.fromisoformat(spike['start'])
-            end = datetime.fromisoformat(spike['end'])
+            start = spike['_start_dt']
+            end = spike['_end_dt']
             start_str = start.strftime('%H:%M')
             end_str = end.strftime('%H:%M')
             self.ax.axvspan(
@@ -180,8 +197,8 @@ class SpikeEditor:
             with open(self.json_path, 'r') as f:
                 all_spikes = json.load(f)
         
-        # Add new spikes
-        all_spikes.extend(self.new_spikes)
+        # Add new spikes (without cached datetime fields)
+        all_spikes.extend(self._strip_spike(spike) for spike in self.new_spikes)
         
         # Sort by start time
         all_spikes.sort(key=lambda s: s['start'])
@@ -194,6 +211,8 @@ class SpikeEditor:
     
     def run(self):
         """Start interactive spike editor"""
+        import matplotlib.pyplot as plt
+        
         self._load_day_data()
         
         # Create figure
@@ -233,6 +252,21 @@ def add_spike_interactive(date_str: str, csv_path: Path, json_path: Path):
     editor = SpikeEditor(date_str, csv_path, json_path)
     editor.run()
 
+def read_manual_spikes(json_path: Path) -> List[Dict]:
+    """
+    Read the raw manual spike entries from JSON
+
+    Args:
+        json_path: Path to spikes_manual.json
+
+    Returns:
+        List of dicts with ISO 'start' and 'end' timestamps, empty if no file
+    """
+    if not json_path.exists():
+        return []
+
+    return _json_loads(json_path.read_bytes())
+
 def load_manual_spikes(json_path: Path, cgm_data):
     """
     Load manual spikes from JSON and create Spike objects with CGM data
@@ -244,84 +278,95 @@ def load_manual_spikes(json_path: Path, cgm_data):
     Returns:
         List of Spike objects with full metrics
     """
-    from glucose_analyzer.analysis.spike_detector import Spike
-    from glucose_analyzer.analysis.auc_calculator import SpikeData, analyze_spike
-
-    if not json_path.exists():
-        return []
-
-    with open(json_path, 'r') as f:
-        spike_entries = json.load(f)
+    spike_entries = read_manual_spikes(json_path)
 
     if not spike_entries:
         return []
 
     spikes = []
-
     for entry in spike_entries:
-        start_time = datetime.fromisoformat(entry['start'])
-        end_time = datetime.fromisoformat(entry['end'])
-        
-        # Extract CGM data for this spike's time range
-        mask = (cgm_data['timestamp'] >= start_time) & (cgm_data['timestamp'] <= end_time)
-        spike_data_df = cgm_data[mask].copy()
-        
-        if len(spike_data_df) == 0:
-            print(f"[WARNING] No CGM data found for spike {start_time} to {end_time}")
-            continue
-        
-        # Find key points in the spike
-        start_glucose = spike_data_df.iloc[0]['glucose']
-        end_glucose = spike_data_df.iloc[-1]['glucose']
-        
-        # Find peak
-        peak_idx = spike_data_df['glucose'].idxmax()
-        peak_time = spike_data_df.loc[peak_idx, 'timestamp']
-        peak_glucose = spike_data_df.loc[peak_idx, 'glucose']
-        
-        # Calculate metrics
-        magnitude = peak_glucose - start_glucose
-        duration = (end_time - start_time).total_seconds() / 60
-        time_to_peak = (peak_time - start_time).total_seconds() / 60
-        
-        # Create Spike object
-        spike = Spike(
-            start_time=start_time,
-            start_glucose=start_glucose,
-            peak_time=peak_time,
-            peak_glucose=peak_glucose,
-            end_time=end_time,
-            end_glucose=end_glucose,
-            duration_minutes=duration,
-            time_to_peak_minutes=time_to_peak,
-            magnitude=magnitude,
-            end_reason='manual',
-            baseline=start_glucose
-        )
-        
-        # Calculate AUC metrics
-        spike_data_df['minutes_from_start'] = (
-            (spike_data_df['timestamp'] - start_time).dt.total_seconds() / 60
-        )
-        
-        spike_data_obj = SpikeData(
-            timestamps=spike_data_df['minutes_from_start'].tolist(),
-            glucose=spike_data_df['glucose'].tolist(),
-            baseline=start_glucose,
-            peak=peak_glucose,
-            meal_time=start_time.isoformat(),
-            glycemic_load=0
-        )
-        
-        auc_results = analyze_spike(spike_data_obj)
-        
-        # Update spike with AUC metrics
-        spike.auc_0 = auc_results.auc_0
-        spike.auc_70 = auc_results.auc_70
-        spike.auc_relative = auc_results.auc_relative
-        spike.normalized_auc = auc_results.normalized_auc
-        spike.recovery_time = auc_results.recovery_time
-        
-        spikes.append(spike)
+        spike = _build_manual_spike(entry, cgm_data)
+        if spike is not None:
+            spikes.append(spike)
+
+    return spikes
+
+def _build_manual_spike(entry: Dict, cgm_data):
+    """
+    Build a single Spike object from a manual spike entry
+
+    Args:
+        entry: Dict with ISO 'start' and 'end' timestamps
+        cgm_data: DataFrame with CGM data (from LibreViewParser)
+
+    Returns:
+        Spike object with full metrics, or None if no CGM data in range
+    """
+    from glucose_analyzer.analysis.spike_detector import Spike
+    from glucose_analyzer.analysis.auc_calculator import SpikeData, analyze_spike
 
-    return spikes
\ No newline at end of file
+    start_time = datetime.fromisoformat(entry['start'])
+    end_time = datetime.fromisoformat(entry['end'])
+    
+    # Extract CGM data for this spike's time range
+    mask = (cgm_data['timestamp'] >= start_time) & (cgm_data['timestamp'] <= end_time)
+    spike_data_df = cgm_data[mask].copy()
+    
+    if len(spike_data_df) == 0:
+        print(f"[WARNING] No CGM data found for spike {start_time} to {end_time}")
+        return None
+    
+    # Find key points in the spike (plain positional indexing, no label lookups)
+    glucose = spike_data_df['glucose'].to_numpy()
+    timestamps = spike_data_df['timestamp'].array
+    peak_i = int(np.argmax(glucose))
+    
+    start_glucose = glucose[0]
+    end_glucose = glucose[-1]
+    peak_glucose = glucose[peak_i]
+    peak_time = timestamps[peak_i]
+    
+    # Calculate metrics
+    magnitude = peak_glucose - start_glucose
+    duration = (end_time - start_time).total_seconds() / 60
+    time_to_peak = (peak_time - start_time).total_seconds() / 60
+    
+    # Create Spike object
+    spike = Spike(
+        start_time=start_time,
+        start_glucose=start_glucose,
+        peak_time=peak_time,
+        peak_glucose=peak_glucose,
+        end_time=end_time,
+        end_glucose=end_glucose,
+        duration_minutes=duration,
+        time_to_peak_minutes=time_to_peak,
+        magnitude=magnitude,
+        end_reason='manual',
+        baseline=start_glucose
+    )
+    
+    # Calculate AUC metrics
+    spike_data_df['minutes_from_start'] = (
+        (spike_data_df['timestamp'] - start_time).dt.total_seconds() / 60
+    )
+    
+    spike_data_obj = SpikeData(
+        timestamps=spike_data_df['minutes_from_start'].to_numpy(),
+        glucose=spike_data_df['glucose'].to_numpy(),
+        baseline=start_glucose,
+        peak=peak_glucose,
+        meal_time=start_time.isoformat(),
+        glycemic_load=0
+    )
+    
+    auc_results = analyze_spike(spike_data_obj)
+    
+    # Update spike with AUC metrics
+    spike.auc_0 = auc_results.auc_0
+    spike.auc_70 = auc_results.auc_70
+    spike.auc_relative = auc_results.auc_relative
+    spike.normalized_auc = auc_results.normalized_auc
+    spike.recovery_time = auc_results.recovery_time
+    
+    return spike
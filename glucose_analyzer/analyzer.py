@@ -1,47 +1,231 @@
 """Main analyzer class for glucose spike analysis"""
 
+import functools
+import hashlib
+import json
 import os
+import pickle
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from glucose_analyzer.utils.config import Config
 from glucose_analyzer.utils.data_manager import DataManager
+from glucose_analyzer.utils.timestamps import parse_timestamp
 from glucose_analyzer.parsers.csv_parser import LibreViewParser
 from glucose_analyzer.analysis.spike_detector import SpikeDetector
 from glucose_analyzer.analysis.meal_matcher import MealMatcher
-from glucose_analyzer.analysis.normalizer import SpikeNormalizer
-from glucose_analyzer.analysis.group_analyzer import GroupAnalyzer
-from glucose_analyzer.visualization.charts import ChartGenerator
 from glucose_analyzer.analysis.spike_manual import load_manual_spikes
 
+if TYPE_CHECKING:
+    from glucose_analyzer.visualization.charts import ChartGenerator
+
+# Per-user directory for pickled caches. Unpickling can run arbitrary code, so
+# caches are only read from here (trusted like the user's own files) and never
+# from data or output directories
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'glucose_analyzer')
+
+# Version stamped into every cache payload; bump when a payload's layout changes
+CACHE_VERSION = 2
+
+# Errors meaning a cache file is unreadable or was written by incompatible code
+CACHE_LOAD_ERRORS = (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError)
+
+# Suffix of the pickled CGM parse cache files
+CGM_CACHE_SUFFIX = '.cache.pkl'
+
+# Suffix of the pickled analysis result cache files
+ANALYSIS_CACHE_SUFFIX = '.analysis.pkl'
+
+# Per-match columns kept alongside the matched list for vectorized filtering
+MATCH_ARRAY_DTYPE = [('meal_time', 'datetime64[s]'), ('gl', 'f8')]
+
+# Analysis report separators
+EQ_LINE = "=" * 80
+DASH_LINE = "-" * 80
+
+
+def _minute_strings(times):
+    """
+    Format datetimes as 'YYYY-MM-DD HH:MM' strings in one vectorized pass
+    
+    Args:
+        times: List of datetimes
+        
+    Returns:
+        list: Formatted strings, same order as times
+    """
+    iso = np.datetime_as_string(np.array(times, dtype='datetime64[m]'))
+    return [ts[:10] + ' ' + ts[11:] for ts in iso.tolist()]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_group_bounds(start, end):
+    """
+    Parse group start/end strings into datetime64 bounds
+    
+    Args:
+        start: Group start timestamp (YYYY-MM-DD:HH:MM)
+        end: Group end timestamp, or None for an open group
+        
+    Returns:
+        tuple: (start, end) as np.datetime64[s]
+    """
+    start_dt = np.datetime64(parse_timestamp(start), 's')
+    
+    # Handle OPEN groups (no end date yet) - use far future date
+    if end is None:
+        end_dt = np.datetime64('9999-12-31T23:59', 's')
+    else:
+        end_dt = np.datetime64(parse_timestamp(end), 's')
+    
+    return start_dt, end_dt
+
+
+class TimeIndex:
+    """Items sorted by timestamp for repeated inclusive range queries"""
+    
+    def __init__(self, items, times):
+        """
+        Initialize the index
+        
+        Args:
+            items: List of items
+            times: Timestamp for each item (datetimes or a datetime64 array)
+        """
+        if not isinstance(times, np.ndarray):
+            times = np.array(times, dtype='datetime64[s]')
+        self.items = items
+        self.order = np.argsort(times, kind='stable')
+        self.times = times[self.order]
+    
+    def in_range(self, start, end):
+        """
+        Get items with start <= time <= end
+        
+        Args:
+            start: Range start (same type as the indexed times)
+            end: Range end (same type as the indexed times)
+            
+        Returns:
+            list: Matching items in their original order
+        """
+        return [self.items[i] for i in self.positions_in_range(start, end)]
+    
+    def positions_in_range(self, start, end):
+        """
+        Get positions (into items) of items with start <= time <= end
+        
+        Args:
+            start: Range start (same type as the indexed times)
+            end: Range end (same type as the indexed times)
+            
+        Returns:
+            np.ndarray: Ascending item positions
+        """
+        if self.times.dtype.kind == 'M':
+            start, end = np.datetime64(start, 's'), np.datetime64(end, 's')
+        lo = np.searchsorted(self.times, start, side='left')
+        hi = np.searchsorted(self.times, end, side='right')
+        return np.sort(self.order[lo:hi])
+
+
 class GlucoseAnalyzer:
     """Main analyzer application"""
     
-    def __init__(self, config_path='config.json'):
+    def __init__(self, config_path='config.json', verbose=True):
         """
         Initialize the analyzer
         
         Args:
             config_path: Path to configuration file
+            verbose: If False, run_analysis skips per-spike and per-match detail output
         """
         self.config = Config(config_path)
+        self.verbose = verbose
+        
+        # Data file locations, read from config once
+        self.csv_path = self.config.get('data_files', 'libreview_csv')
+        self.manual_spikes_path = Path(self.config.get('data_files', 'spikes_manual_json'))
+        
         self.data_manager = DataManager(self.config.get('data_files', 'meals_json'))
         self.cgm_data = None
         self.cgm_parser = None
+        self._cgm_key = None
         self.spike_detector = SpikeDetector(self.config)
         self.meal_matcher = MealMatcher(self.config)
         self.detected_spikes = []
+        self.spike_stats = None
         self.match_results = None
-        self.normalizer = SpikeNormalizer()
-        self.normalized_profiles = []
-        self.group_analyzer = GroupAnalyzer()
-        self.chart_generator = ChartGenerator(self.config)
+        self._normalized_profiles = []
+        self._profile_index = TimeIndex([], [])
+        self._matched_index = None
+        self._matched_arrays = None
+        self._unmatched_spikes_index = None
+        self._unmatched_meals_index = None
+        self._group_buckets = None
+        self._group_buckets_key = None
+        self._groups_by_desc = {}
+        self._groups_by_desc_key = None
+        self._group_analysis_cache = {}
+        self._analysis_sig = None
+        self._last_result = None
+        self._manual_spikes_cache = None
         
         # Create charts directory if it doesn't exist
-        charts_dir = self.config.get('output', 'charts_directory')
-        Path(charts_dir).mkdir(exist_ok=True)
+        self.charts_dir = self.config.get('output', 'charts_directory')
+        os.makedirs(self.charts_dir, exist_ok=True)
+        
+        # Try to load CGM data on startup, then the last analysis of it
+        if self.load_cgm_data():
+            self._load_analysis_cache()
+    
+    @property
+    def normalized_profiles(self):
+        """
+        Normalized profiles of the matched spikes
+        
+        Normalization resamples every matched spike, so it is deferred from
+        run_analysis to the first compare or chart that needs the profiles.
         
-        # Try to load CGM data on startup
-        self.load_cgm_data()
+        Returns:
+            list: NormalizedProfile objects
+        """
+        if self._normalized_profiles is None:
+            self._normalized_profiles = self.normalizer.normalize_matches(
+                self.match_results['matched'],
+                self.cgm_data
+            )
+            self._index_profiles()
+        return self._normalized_profiles
+    
+    @functools.cached_property
+    def groups(self):
+        """Group list from the data manager (mutated in place, so safe to hold)"""
+        return self.data_manager.data["groups"]
+    
+    # Helpers below are imported on first use so commands that never chart
+    # or group don't pay for matplotlib and the analysis modules at startup
+    
+    @functools.cached_property
+    def normalizer(self):
+        """Spike normalizer, created on first use"""
+        from glucose_analyzer.analysis.normalizer import SpikeNormalizer
+        return SpikeNormalizer()
+    
+    @functools.cached_property
+    def group_analyzer(self):
+        """Group analyzer, created on first use"""
+        from glucose_analyzer.analysis.group_analyzer import GroupAnalyzer
+        return GroupAnalyzer()
+    
+    @functools.cached_property
+    def chart_generator(self) -> 'ChartGenerator':
+        """Chart generator, created (and matplotlib imported) on first chart"""
+        from glucose_analyzer.visualization.charts import ChartGenerator
+        return ChartGenerator(self.config, charts_dir=self.charts_dir)
     
     def load_cgm_data(self):
         """
@@ -50,7 +234,7 @@ class GlucoseAnalyzer:
         Returns:
             bool: True if data loaded successfully, False otherwise
         """
-        csv_path = self.config.get('data_files', 'libreview_csv')
+        csv_path = self.csv_path
         
         if not os.path.exists(csv_path):
             # CSV file doesn't exist yet - not an error, just skip loading
@@ -59,8 +243,15 @@ class GlucoseAnalyzer:
         try:
             print(f"[INFO] Loading CGM data from {csv_path}...")
             self.cgm_parser = LibreViewParser(csv_path)
-            self.cgm_parser.parse()
+            
+            # Reuse the parsed data from a previous run if the CSV is unchanged
+            cache_key = self._cgm_cache_key(csv_path)
+            if not self._load_cgm_cache(csv_path, cache_key):
+                self.cgm_parser.parse()
+                self._save_cgm_cache(csv_path, cache_key)
+            
             self.cgm_data = self.cgm_parser.get_auto_readings()
+            self._cgm_key = cache_key
             
             stats = self.cgm_parser.get_stats()
             print(f"[OK] Loaded {stats['type_0_count']} CGM readings")
@@ -71,117 +262,497 @@ class GlucoseAnalyzer:
             print(f"[ERROR] Failed to load CGM data: {e}")
             return False
     
-    def run_analysis(self, auto=False):
+    def _cgm_cache_key(self, csv_path):
+        """Cache key identifying the current contents of the CSV file"""
+        st = os.stat(csv_path)
+        return (os.path.abspath(csv_path), st.st_mtime_ns, st.st_size)
+    
+    @staticmethod
+    def _cgm_cache_path(csv_path):
+        """
+        Parse cache location for a CSV file, in the user cache directory
+        
+        Args:
+            csv_path: Path to the LibreView CSV file
+            
+        Returns:
+            str: Cache file path, named by a digest of the CSV's absolute path
+        """
+        digest = hashlib.sha1(os.path.abspath(csv_path).encode('utf-8')).hexdigest()
+        return os.path.join(CACHE_DIR, digest + CGM_CACHE_SUFFIX)
+    
+    def _load_cgm_cache(self, csv_path, cache_key):
+        """
+        Restore parsed CGM data from the on-disk cache
+        
+        Args:
+            csv_path: Path to the LibreView CSV file
+            cache_key: Key from _cgm_cache_key() for the current CSV
+            
+        Returns:
+            bool: True if the cache matched and was loaded, False otherwise
+        """
+        cache_path = self._cgm_cache_path(csv_path)
+        if not os.path.exists(cache_path):
+            return False
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                payload = pickle.load(f)
+        except CACHE_LOAD_ERRORS as e:
+            print(f"[WARNING] Ignoring unreadable CGM cache {cache_path}: {e}")
+            return False
+        
+        # Written by another version, or for an older copy of the CSV
+        if (not isinstance(payload, dict) or payload.get('version') != CACHE_VERSION
+                or payload.get('key') != cache_key):
+            return False
+        
+        self.cgm_parser.data = payload['data']
+        self.cgm_parser._stats = payload['stats']
+        return True
+    
+    def _save_cgm_cache(self, csv_path, cache_key):
+        """Write parsed CGM data to the user cache for reuse on the next run"""
+        payload = {
+            'version': CACHE_VERSION,
+            'key': cache_key,
+            'data': self.cgm_parser.data,
+            'stats': self.cgm_parser.get_stats()
+        }
+        cache_path = self._cgm_cache_path(csv_path)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"[WARNING] Could not write CGM cache: {e}")
+    
+    def run_analysis(self, auto=False, verbose=None):
         """
         Run spike analysis and meal matching
         
         Args:
             auto: If True, use auto spike detection. If False (default), load manual spikes.
+            verbose: If True, print per-spike and per-match details. Defaults to self.verbose.
         
         Returns:
             bool: True if analysis completed successfully
         """
+        if verbose is None:
+            verbose = self.verbose
+        
         if self.cgm_data is None:
             print("[ERROR] No CGM data loaded. Cannot run analysis.")
             return False
         
-        print("\n" + "="*80)
-        print("GLUCOSE SPIKE ANALYSIS")
-        print("="*80)
+        # Skip the pipeline when nothing it depends on has changed, but
+        # still report the reused result like a fresh run
+        sig = self._analysis_signature(auto)
+        if sig == self._analysis_sig and self._last_result is not None:
+            self._write_lines(self._format_analysis(self._last_result, verbose))
+            return True
+        
+        result = self._compute_analysis(auto)
+        self._write_lines(self._format_analysis(result, verbose))
+        
+        if result['success']:
+            self._analysis_sig = sig
+            self._last_result = result
+            self._save_analysis_cache()
+        else:
+            # The attributes now hold this failed run, not the reusable one
+            self._analysis_sig = None
+            self._last_result = None
+        return result['success']
+
+    def _compute_analysis(self, auto=False):
+        """
+        Get spikes and match meals without printing
+        
+        Updates detected_spikes, spike_stats and match_results along with
+        their indexes; normalized profiles are rebuilt on next access.
+        
+        Args:
+            auto: If True, use auto spike detection. If False, load manual spikes.
+        
+        Returns:
+            dict: Analysis summary consumed by _format_analysis
+        """
+        result = {
+            'auto': auto,
+            'success': False,
+            'spikes': [],
+            'meal_count': 0,
+            'match_results': None,
+            'match_stats': None
+        }
         
         # Step 1: Get spikes (manual or auto)
         if auto:
-            print("\n[INFO] Using AUTO spike detection (legacy mode)...")
-            print("[INFO] Detecting glucose spikes in CGM data...")
             self.detected_spikes = self.spike_detector.detect_spikes(self.cgm_data)
-            
-            if not self.detected_spikes:
-                print("[WARNING] No spikes detected with current thresholds")
-                return False
-            
-            print(f"[OK] Detected {len(self.detected_spikes)} spike(s)")
+            self.spike_stats = self.spike_detector.last_stats
         else:
-            print("\n[INFO] Loading manual spikes from JSON...")
-            json_path = Path(self.config.get('data_files', 'spikes_manual_json'))
-            self.detected_spikes = load_manual_spikes(json_path, self.cgm_data)
-            
-            if not self.detected_spikes:
-                print("[ERROR] No manual spikes found.")
-                print("[INFO] Use 'addspike YYYY-MM-DD' to define spikes interactively.")
-                print("[INFO] Or use 'analyze --auto' for automatic spike detection.")
-                return False
-            
-            print(f"[OK] Loaded {len(self.detected_spikes)} manual spike(s)")
+            self.detected_spikes = self._load_manual_spikes()
         
-        # Show spike summary
-        for i, spike in enumerate(self.detected_spikes, 1):
-            print(f"\nSpike {i}: {spike.start_time.strftime('%Y-%m-%d %H:%M')} to "
-                f"{spike.end_time.strftime('%H:%M')}")
-            print(f"  Duration: {spike.duration_minutes:.0f} min, "
-                f"Peak: {spike.peak_glucose:.0f} mg/dL (+{spike.magnitude:.0f})")
-            print(f"  AUC-relative: {spike.auc_relative:.0f} mg/dL*min")
+        result['spikes'] = self.detected_spikes
+        if not self.detected_spikes:
+            return result
         
         # Step 2: Match meals with spikes
         meals = self.data_manager.data['meals']
+        result['meal_count'] = len(meals)
         
         if meals:
-            print(f"\n[INFO] Matching {len(meals)} meal(s) with {len(self.detected_spikes)} spike(s)...")
             self.match_results = self.meal_matcher.match_meals_to_spikes(
                 meals, 
                 self.detected_spikes
             )
+            match_stats = self.meal_matcher.last_stats
+            self._group_analysis_cache.clear()
+            self._index_matches()
+            result['match_results'] = self.match_results
+            result['match_stats'] = match_stats
             
-            match_stats = self.meal_matcher.get_stats(self.match_results)
-            
-            print(f"\n[OK] Matched {match_stats['matched_count']} meal(s) to spikes")
-            
+            # Normalize matched profiles lazily (see normalized_profiles)
             if match_stats['matched_count'] > 0:
-                print(f"\nMatched Meal-Spike Pairs:")
-                print("-" * 80)
-                for i, match in enumerate(self.match_results['matched'], 1):
-                    meal_str = ", ".join([f"{m['timestamp']} (GL={m['gl']})" for m in match.meals])
+                self._normalized_profiles = None
+        
+        result['success'] = True
+        return result
+
+    @staticmethod
+    def _format_analysis(result, verbose=True):
+        """
+        Format an analysis summary as report lines
+        
+        Args:
+            result: Dict returned by _compute_analysis
+            verbose: If True, include per-spike and per-match details
+        
+        Returns:
+            list: Report lines
+        """
+        out = []
+        p = out.append
+        spikes = result['spikes']
+        
+        p("\n" + EQ_LINE)
+        p("GLUCOSE SPIKE ANALYSIS")
+        p(EQ_LINE)
+        
+        # Step 1: Spikes (manual or auto)
+        if result['auto']:
+            p("\n[INFO] Using AUTO spike detection (legacy mode)...")
+            p("[INFO] Detecting glucose spikes in CGM data...")
+            if not spikes:
+                p("[WARNING] No spikes detected with current thresholds")
+                return out
+            p(f"[OK] Detected {len(spikes)} spike(s)")
+        else:
+            p("\n[INFO] Loading manual spikes from JSON...")
+            if not spikes:
+                p("[ERROR] No manual spikes found.")
+                p("[INFO] Use 'addspike YYYY-MM-DD' to define spikes interactively.")
+                p("[INFO] Or use 'analyze --auto' for automatic spike detection.")
+                return out
+            p(f"[OK] Loaded {len(spikes)} manual spike(s)")
+        
+        # Show spike summary
+        if verbose:
+            starts = _minute_strings([s.start_time for s in spikes])
+            ends = _minute_strings([s.end_time for s in spikes])
+            for i, (spike, start, end) in enumerate(zip(spikes, starts, ends), 1):
+                p(f"\nSpike {i}: {start} to {end[11:]}")
+                p(f"  Duration: {spike.duration_minutes:.0f} min, "
+                    f"Peak: {spike.peak_glucose:.0f} mg/dL (+{spike.magnitude:.0f})")
+                p(f"  AUC-relative: {spike.auc_relative:.0f} mg/dL*min")
+        
+        # Step 2: Meal matching
+        match_stats = result['match_stats']
+        
+        if match_stats is None:
+            p("\n[INFO] No meals logged. Add meals with 'addmeal' to enable matching.")
+            p("[INFO] Spike detection complete without meal matching.")
+            return out
+        
+        match_results = result['match_results']
+        p(f"\n[INFO] Matching {result['meal_count']} meal(s) with {len(spikes)} spike(s)...")
+        p(f"\n[OK] Matched {match_stats['matched_count']} meal(s) to spikes")
+        
+        if match_stats['matched_count'] > 0:
+            if verbose:
+                p(f"\nMatched Meal-Spike Pairs:")
+                p(DASH_LINE)
+                for match in match_results['matched']:
+                    spike = match.spike
                     # Handle single vs multi-meal display
                     if match.meal_count == 1:
-                        print(f"  Meal: {match.meals[0]['timestamp']} (GL={match.total_gl})")
+                        p(f"  Meal: {match.meals[0]['timestamp']} (GL={match.total_gl})")
                     else:
                         meal_times = [m['timestamp'] for m in match.meals]
-                        print(f"  Meals: {match.meal_count} meals - {', '.join(meal_times)} (Total GL={match.total_gl})")
-                    print(f"  Spike: {match.spike.start_time.strftime('%Y-%m-%d %H:%M')} "
-                        f"to {match.spike.end_time.strftime('%H:%M')}")
-                    earliest_delay = min(match.meal_delays) if match.meal_delays else 0
-                    print(f"  Delay: {earliest_delay:.0f} minutes")
-                    print(f"   Duration: {match.spike.duration_minutes:.0f} minutes")
-                    print(f"   Peak: {match.spike.peak_glucose:.0f} mg/dL (+{match.spike.magnitude:.0f})")
+                        p(f"  Meals: {match.meal_count} meals - {', '.join(meal_times)} (Total GL={match.total_gl})")
+                    p(f"  Spike: {spike.start_str} "
+                        f"to {spike.end_hm}")
+                    p(f"  Delay: {match.earliest_delay:.0f} minutes")
+                    p(f"   Duration: {spike.duration_minutes:.0f} minutes")
+                    p(f"   Peak: {spike.peak_glucose:.0f} mg/dL (+{spike.magnitude:.0f})")
                     if match.meal_count > 1:
-                        print(f"   [COMPLEX] {match.meal_count} contributing meals (total GL={match.total_gl}):")
-                        for i, meal in enumerate(match.meals):
-                            delay = match.meal_delays[i]
-                            print(f"    - {meal['timestamp']} (GL={meal['gl']}, {delay:.0f} min before spike)")
-                    print(f"   AUC-relative: {match.spike.auc_relative:.0f} mg/dL*min, "
-                        f"Normalized: {match.spike.normalized_auc:.3f}")
-                    if match.spike.recovery_time:
-                        print(f"   Recovery: {match.spike.recovery_time:.0f} minutes")
+                        p(f"   [COMPLEX] {match.meal_count} contributing meals (total GL={match.total_gl}):")
+                        for meal, delay in zip(match.meals, match.meal_delays):
+                            p(f"    - {meal['timestamp']} (GL={meal['gl']}, {delay:.0f} min before spike)")
+                    p(f"   AUC-relative: {spike.auc_relative:.0f} mg/dL*min, "
+                        f"Normalized: {spike.normalized_auc:.3f}")
+                    if spike.recovery_time:
+                        p(f"   Recovery: {spike.recovery_time:.0f} minutes")
+            
+            # Counted without normalizing; the profiles are built on first compare or chart
+            profile_count = sum(1 for m in match_results['matched'] if m.spike is not None)
+            p(f"\n[OK] {profile_count} spike profiles available (normalized on first compare or chart)")
+        
+        # Show unmatched spikes if any
+        if match_stats['unmatched_spikes'] > 0:
+            p(f"\n[WARNING] {match_stats['unmatched_spikes']} unexplained spike(s):")
+            if verbose:
+                for spike in match_results['unmatched_spikes'][:3]:
+                    p(f"  {spike.start_str} - "
+                        f"Peak: {spike.peak_glucose:.0f} mg/dL (+{spike.magnitude:.0f})")
+        
+        return out
 
-                # Normalize matched profiles
-                if match_stats['matched_count'] > 0:
-                    print(f"\nCreating normalized profiles...")
-                    self.normalized_profiles = self.normalizer.normalize_matches(
-                        self.match_results['matched'], 
-                        self.cgm_data
-                    )
-                    print(f"[OK] Normalized {len(self.normalized_profiles)} spike profiles")
+    def _manual_spikes_signature(self):
+        """
+        Signature of the manual spikes JSON file
+        
+        Returns:
+            tuple: (mtime_ns, size), or None if the file is missing
+        """
+        try:
+            st = os.stat(self.manual_spikes_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _load_manual_spikes(self):
+        """
+        Load manual spikes, reusing the last result while the JSON and CGM data are unchanged
+        
+        Returns:
+            list: Spike objects built from the manual spikes JSON
+        """
+        key = (self._manual_spikes_signature(), self._cgm_key)
+        if self._manual_spikes_cache is not None and self._manual_spikes_cache[0] == key:
+            return self._manual_spikes_cache[1]
+        
+        spikes = load_manual_spikes(self.manual_spikes_path, self.cgm_data)
+        self._manual_spikes_cache = (key, spikes)
+        return spikes
+    
+    def _analysis_signature(self, auto):
+        """
+        Signature of everything run_analysis depends on
+        
+        Args:
+            auto: Spike detection mode passed to run_analysis
+            
+        Returns:
+            tuple: Comparable signature of CGM data, spikes source, meals and config
+        """
+        spikes_sig = None if auto else self._manual_spikes_signature()
+        
+        meals_sig = tuple((m['timestamp'], m['gl']) for m in self.data_manager.data['meals'])
+        config_sig = json.dumps(self.config.data, sort_keys=True)
+        return (auto, self._cgm_key, spikes_sig, meals_sig, config_sig)
+    
+    def _analysis_cache_path(self):
+        """
+        Analysis cache location for this charts directory, in the user cache directory
+        
+        Returns:
+            str: Cache file path, named by a digest of the charts directory's absolute path
+        """
+        digest = hashlib.sha1(os.path.abspath(self.charts_dir).encode('utf-8')).hexdigest()
+        return os.path.join(CACHE_DIR, digest + ANALYSIS_CACHE_SUFFIX)
+    
+    def _load_analysis_cache(self):
+        """
+        Restore the last analysis results if their inputs are unchanged
+        
+        Returns:
+            bool: True if cached results were restored, False otherwise
+        """
+        cache_path = self._analysis_cache_path()
+        if not os.path.exists(cache_path):
+            return False
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                payload = pickle.load(f)
+        except CACHE_LOAD_ERRORS as e:
+            print(f"[WARNING] Ignoring unreadable analysis cache {cache_path}: {e}")
+            return False
+        
+        if not isinstance(payload, dict) or payload.get('version') != CACHE_VERSION:
+            return False
+        
+        # The first signature field is the detection mode the results came from
+        sig = payload['sig']
+        if sig != self._analysis_signature(sig[0]):
+            return False
+        
+        result = payload['result']
+        spikes = result['spikes']
+        match_results = result['match_results']
+        profiles = payload['profiles']
+        self.detected_spikes = spikes
+        self.spike_stats = payload['spike_stats']
+        self.match_results = match_results
+        self._normalized_profiles = profiles
+        if match_results:
+            self._index_matches()
+        if profiles is not None:
+            self._index_profiles()
+        self._analysis_sig = sig
+        self._last_result = result
+        
+        matched = len(match_results['matched']) if match_results else 0
+        print(f"[INFO] Restored previous analysis: {len(spikes)} spike(s), "
+              f"{matched} matched meal-spike pair(s)")
+        return True
+    
+    def _save_analysis_cache(self):
+        """Write the current analysis results to the user cache for reuse on the next run"""
+        payload = {
+            'version': CACHE_VERSION,
+            'sig': self._analysis_sig,
+            'result': self._last_result,
+            'spike_stats': self.spike_stats,
+            'profiles': self._normalized_profiles
+        }
+        cache_path = self._analysis_cache_path()
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"[WARNING] Could not write analysis cache: {e}")
 
-            # Show unmatched spikes if any
-            if match_stats['unmatched_spikes'] > 0:
-                print(f"\n[WARNING] {match_stats['unmatched_spikes']} unexplained spike(s):")
-                for spike in self.match_results['unmatched_spikes'][:3]:
-                    print(f"  {spike.start_time.strftime('%Y-%m-%d %H:%M')} - "
-                        f"Peak: {spike.peak_glucose:.0f} mg/dL (+{spike.magnitude:.0f})")
-        else:
-            print("\n[INFO] No meals logged. Add meals with 'addmeal' to enable matching.")
-            print("[INFO] Spike detection complete without meal matching.")
+    @staticmethod
+    def _write_lines(lines):
+        """Write buffered output lines to stdout in one call and clear the buffer"""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+
+    def _index_matches(self):
+        """Sort matched and unmatched items by time once so group filters are binary searches"""
+        matched = [m for m in self.match_results['matched'] if m.meals]
+        unmatched_spikes = self.match_results['unmatched_spikes']
+        unmatched_meals = self.match_results['unmatched_meals']
+        
+        # Column view of the matches; they are grouped by their first (earliest) meal
+        arrays = np.empty(len(matched), dtype=MATCH_ARRAY_DTYPE)
+        for i, m in enumerate(matched):
+            arrays[i] = (parse_timestamp(m.meals[0]['timestamp']), m.total_gl)
+        self._matched_arrays = arrays
+        self._matched_index = TimeIndex(matched, arrays['meal_time'])
+        self._unmatched_spikes_index = TimeIndex(unmatched_spikes, [s.start_time for s in unmatched_spikes])
+        self._unmatched_meals_index = TimeIndex(unmatched_meals, [parse_timestamp(m['timestamp']) for m in unmatched_meals])
+        self._group_buckets = None
+    
+    def _index_profiles(self):
+        """Parse and sort profile start times once so group filters are binary searches"""
+        self._profile_index = TimeIndex(
+            self._normalized_profiles,
+            np.array([p.spike_start_time for p in self._normalized_profiles], dtype='datetime64[s]')
+        )
+    
+    @staticmethod
+    def _group_bounds(group_info):
+        """
+        Get a group's start and end as datetime64 bounds
+        
+        Args:
+            group_info: Dict with 'start' and 'end' timestamps
+            
+        Returns:
+            tuple: (start, end) as np.datetime64, parsed once per distinct pair
+        """
+        return _parse_group_bounds(group_info['start'], group_info['end'])
+    
+    def _get_group_buckets(self):
+        """
+        Get matched/unmatched items bucketed by group, building them if needed
+        
+        Buckets are rebuilt after each analysis and whenever group bounds change.
         
-        return True    
+        Returns:
+            list: (match_positions, unmatched_spikes, unmatched_meals) tuple per group index,
+                  where match_positions index into the matched index and _matched_arrays
+        """
+        groups = self.groups
+        key = tuple((g['start'], g['end']) for g in groups)
+        
+        if self._group_buckets is None or self._group_buckets_key != key:
+            buckets = []
+            for group_info in groups:
+                start_dt, end_dt = self._group_bounds(group_info)
+                buckets.append((
+                    self._matched_index.positions_in_range(start_dt, end_dt),
+                    self._unmatched_spikes_index.in_range(start_dt, end_dt),
+                    self._unmatched_meals_index.in_range(start_dt, end_dt)
+                ))
+            self._group_buckets = buckets
+            self._group_buckets_key = key
+        
+        return self._group_buckets
+    
+    def _get_groups_by_desc(self):
+        """
+        Get a description -> group lookup, rebuilding it when groups change
+        
+        Returns:
+            dict: Group dict keyed by description (last one wins on duplicates)
+        """
+        groups = self.groups
+        key = tuple(g['description'] for g in groups)
+        
+        if self._groups_by_desc_key != key:
+            self._groups_by_desc = {g['description']: g for g in groups}
+            self._groups_by_desc_key = key
+        
+        return self._groups_by_desc
+    
+    def profiles_in_range(self, start=None, end=None):
+        """
+        Get normalized profiles whose spike start falls within a time range
+        
+        Args:
+            start: Optional inclusive range start (datetime or np.datetime64)
+            end: Optional inclusive range end (datetime or np.datetime64)
+            
+        Returns:
+            list: Profiles in original order
+        """
+        if self._normalized_profiles is None:
+            self.normalized_profiles  # builds the pending profiles and their index
+        if start is None:
+            start = np.datetime64('0001-01-01T00:00', 's')
+        if end is None:
+            end = np.datetime64('9999-12-31T23:59', 's')
+        return self._profile_index.in_range(start, end)
+    
+    def profiles_in_group(self, group_info):
+        """
+        Get normalized profiles whose spike start falls within a group's date range
+        
+        Args:
+            group_info: Dict with 'start' and 'end' timestamps
+            
+        Returns:
+            list: Profiles in original order
+        """
+        return self.profiles_in_range(*self._group_bounds(group_info))
 
     def generate_chart(self, chart_type, *args):
         """
@@ -281,6 +852,18 @@ class GlucoseAnalyzer:
         print(f"[OK] Chart saved: {filepath}")
         return filepath
 
+    def find_group(self, description):
+        """
+        Look up a group by its description
+        
+        Args:
+            description: Group description
+            
+        Returns:
+            dict: Group (the last one on duplicate descriptions), or None if not found
+        """
+        return self._get_groups_by_desc().get(description)
+    
     def compare_normalized_groups(self, group1_desc, group2_desc):
         """
         Compare normalized profiles between two groups
@@ -292,17 +875,10 @@ class GlucoseAnalyzer:
         Returns:
             dict: Comparison results or None if groups not found
         """
-        groups = self.data_manager.data["groups"]
-        
         # Find groups by description
-        group1 = None
-        group2 = None
-        
-        for g in groups:
-            if g['description'] == group1_desc:
-                group1 = g
-            if g['description'] == group2_desc:
-                group2 = g
+        groups_by_desc = self._get_groups_by_desc()
+        group1 = groups_by_desc.get(group1_desc)
+        group2 = groups_by_desc.get(group2_desc)
         
         if not group1 or not group2:
             print("[ERROR] Could not find one or both groups")
@@ -313,10 +889,8 @@ class GlucoseAnalyzer:
             return None
         
         # Filter profiles by group dates
-        group1_profiles = [p for p in self.normalized_profiles
-                        if group1['start'] <= p.spike_start_time <= (group1['end'] or '9999-12-31')]
-        group2_profiles = [p for p in self.normalized_profiles
-                        if group2['start'] <= p.spike_start_time <= (group2['end'] or '9999-12-31')]
+        group1_profiles = self.profiles_in_group(group1)
+        group2_profiles = self.profiles_in_group(group2)
         
         if not group1_profiles or not group2_profiles:
             print("[ERROR] One or both groups have no normalized profiles")
@@ -342,34 +916,49 @@ class GlucoseAnalyzer:
             print("[ERROR] No analysis results. Run 'analyze' first.")
             return None
         
-        groups = self.data_manager.data["groups"]
+        groups = self.groups
         if group_index < 0 or group_index >= len(groups):
             print(f"[ERROR] Group index {group_index} out of range (0-{len(groups)-1})")
             return None
         
         group_info = groups[group_index]
         
-        # Filter matches by group
-        group_matches = self.group_analyzer.filter_matches_by_group(
-            self.match_results['matched'], 
-            group_info
-        )
+        if gl_range is not None:
+            gl_range = tuple(gl_range)
+        
+        # Group bounds are part of the key so edited groups are re-analyzed
+        key = (group_index, gl_range,
+               group_info['start'], group_info['end'], group_info['description'])
+        analysis = self._group_analysis_cache.get(key)
+        if analysis is None:
+            analysis = self._analyze_group_uncached(group_index, gl_range)
+            self._group_analysis_cache[key] = analysis
+        return analysis
+    
+    def _analyze_group_uncached(self, group_index, gl_range):
+        """
+        Analyze a specific group (results are cached by analyze_group)
+        
+        Args:
+            group_index: Index of group to analyze (already validated)
+            gl_range: Optional tuple (min_gl, max_gl) to filter by GL
+            
+        Returns:
+            dict: Analysis results
+        """
+        group_info = self.groups[group_index]
+        
+        # Matched and unmatched items pre-bucketed by group
+        positions, unmatched_spikes, unmatched_meals = self._get_group_buckets()[group_index]
         
         # Apply GL filter if specified
         if gl_range:
             min_gl, max_gl = gl_range
-            group_matches = self.group_analyzer.filter_by_gl_range(group_matches, min_gl, max_gl)
+            gl = self._matched_arrays['gl'][positions]
+            positions = positions[(gl >= min_gl) & (gl <= max_gl)]
         
-        # Filter unmatched items by group
-        unmatched_spikes = self.group_analyzer.filter_unmatched_by_group(
-            self.match_results['unmatched_spikes'],
-            group_info
-        )
-        
-        unmatched_meals = self.group_analyzer.filter_unmatched_by_group(
-            self.match_results['unmatched_meals'],
-            group_info
-        )
+        matched = self._matched_index.items
+        group_matches = [matched[i] for i in positions]
         
         # Analyze the group
         analysis = self.group_analyzer.analyze_group(
@@ -381,6 +970,23 @@ class GlucoseAnalyzer:
         
         return analysis
 
+    def analyze_groups_batch(self, group_indices, gl_range=None):
+        """
+        Analyze several groups
+        
+        Each distinct group index is analyzed once, in order; repeated
+        indices share the same analysis dict.
+        
+        Args:
+            group_indices: List of group indices
+            gl_range: Optional tuple (min_gl, max_gl) to filter by GL
+            
+        Returns:
+            list: Analysis dict per requested index, None where a group was invalid
+        """
+        results = {i: self.analyze_group(i, gl_range) for i in dict.fromkeys(group_indices)}
+        return [results[i] for i in group_indices]
+
     def compare_groups(self, group1_index, group2_index, gl_range=None):
         """
         Compare two groups
@@ -394,8 +1000,7 @@ class GlucoseAnalyzer:
             GroupComparison object or None if error
         """
         # Analyze both groups
-        analysis1 = self.analyze_group(group1_index, gl_range)
-        analysis2 = self.analyze_group(group2_index, gl_range)
+        analysis1, analysis2 = self.analyze_groups_batch([group1_index, group2_index], gl_range)
         
         if not analysis1 or not analysis2:
             return None
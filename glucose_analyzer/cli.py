@@ -1,11 +1,171 @@
 """Command-line interface for Glucose Analyzer"""
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import json
+import re
+import sys
 
-from glucose_analyzer.analyzer import GlucoseAnalyzer
-from glucose_analyzer.analysis.spike_manual import add_spike_interactive
+from glucose_analyzer.utils.timestamps import parse_timestamp
+
+# Report separators, built once
+_SEP_EQ_60 = "=" * 60
+_SEP_EQ_80 = "=" * 80
+_SEP_DASH_50 = "-" * 50
+_SEP_DASH_70 = "-" * 70
+
+# User-entered date format
+_DATE_FMT = "%Y-%m-%d"
+
+# Zero-padded form of the above, which can be sliced without strptime
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
+
+# One command word: runs of non-whitespace and "quoted" runs (which may hold
+# whitespace) glued together, so a"b c"d is one word; there are no escapes
+_WORD_RE = re.compile(r'(?:[^ \t\r\n"]+|"[^"]*")+')
+
+# Command summary printed by 'help'
+_HELP_TEXT = """
+  addmeal <timestamp> <gl>           Add meal entry
+  addspike <yyyy-mm-dd>              Add spike interactively (click start/end on chart)
+  group start <timestamp> <desc>     Start new analysis group
+  group end <timestamp>              Close current group
+  bypass <timestamp> <reason>        Mark spike as bypassed
+  analyze                            Analyze using manual spikes (default)
+  analyze --auto                     Analyze using auto spike detection (legacy)
+  analyze --quiet                    Analyze, showing only the summary
+  analyze group <n>                  Analyze single group
+  analyze group <n> --gl-range X-Y   Analyze group with GL filter
+  compare groups <n1> <n2>           Compare two groups
+  compare groups <n1> <n2> --gl-range X-Y   Compare with GL filter
+  list meals [start] [end]           List meals in date range
+  list groups                        Show all groups
+  list spikes [start] [end]          List manually defined spikes
+  list matches [start] [end]         List meal-spike matches
+  list unmatched                     Show unmatched spikes and meals
+  list profiles [start] [end]        List normalized spike profiles
+  compare "group1" "group2"          Compare normalized profiles between groups
+  similar <spike_idx> [threshold]    Find spikes with similar shapes (threshold: 0.0-1.0)
+  stats                              Show CGM data statistics
+  chart spike <n> [--normalize]      Chart individual spike
+  chart group <n> [--normalize]      Chart group overlay
+  chart compare <n1> <n2> [--normalize]  Chart group comparison
+  chart scatter <n>                  Chart GL vs AUC scatter
+  timeline <date>                    24-hour chart for specific date
+  timeline-range <start> <end>       Charts for date range
+  overview <start> <end>             Multi-day condensed overview
+  today                              Timeline for current date
+  help                               Show this help
+  quit                               Exit program
+"""
+
+# Interactive command history, kept across sessions when readline is available
+_HISTORY_PATH = Path.home() / '.glucose_analyzer_history'
+_HISTORY_LENGTH = 1000
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(date_str):
+    """
+    Parse a YYYY-MM-DD date, sliced directly like parse_timestamp
+    
+    Args:
+        date_str: Date string
+        
+    Returns:
+        datetime object at midnight
+    """
+    if _DATE_RE.fullmatch(date_str):
+        try:
+            return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, _DATE_FMT)
+
+
+def _parse_range_bound(value):
+    """
+    Parse a list filter bound given as a timestamp or a bare date
+    
+    Args:
+        value: YYYY-MM-DD:HH:MM or YYYY-MM-DD string
+        
+    Returns:
+        datetime object
+        
+    Raises:
+        ValueError: If value is in neither format
+    """
+    if len(value) > 10:
+        return parse_timestamp(value)
+    return _parse_date(value)
+
+
+@lru_cache(maxsize=4096)
+def _iso_to_dt(iso_str):
+    """
+    Parse an ISO timestamp from spikes_manual.json (cached across listings)
+    
+    Args:
+        iso_str: ISO 8601 timestamp string
+        
+    Returns:
+        datetime object
+    """
+    return datetime.fromisoformat(iso_str)
+
+
+def _split_command(line):
+    """
+    Split a command line on whitespace, keeping "double-quoted" text as one word
+    
+    Only double quotes group words, so apostrophes in free text and
+    backslashes in paths are kept as typed.
+    
+    Args:
+        line: Command line string
+        
+    Returns:
+        list: Words with the grouping quotes removed
+        
+    Raises:
+        ValueError: If a double quote is not closed
+    """
+    if line.count('"') % 2:
+        raise ValueError("No closing quotation")
+    return [word.replace('"', '') for word in _WORD_RE.findall(line)]
+
+
+class _RangeIndex:
+    """Items sorted by a key for repeated inclusive range filters"""
+    
+    def __init__(self, items, keys):
+        """
+        Initialize the index
+        
+        Args:
+            items: List of items
+            keys: Sort key for each item
+        """
+        self.items = items
+        self.order = sorted(range(len(items)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in self.order]
+    
+    def in_range(self, start=None, end=None):
+        """
+        Get items with start <= key <= end
+        
+        Args:
+            start: Optional lower bound (inclusive)
+            end: Optional upper bound (inclusive)
+            
+        Returns:
+            list: Matching items in their original order
+        """
+        lo = bisect_left(self.keys, start) if start else 0
+        hi = bisect_right(self.keys, end) if end else len(self.keys)
+        return [self.items[i] for i in sorted(self.order[lo:hi])]
 
 
 class CLI:
@@ -19,7 +179,73 @@ class CLI:
             analyzer: GlucoseAnalyzer instance
         """
         self.analyzer = analyzer
+        self.data_manager = analyzer.data_manager
         self.running = True
+        
+        # Command dispatch: single-word commands, then commands taking a
+        # subcommand word mapped to (subcommand table, fallback), where the
+        # fallback is a handler given all args or an error message to print
+        self._commands = {
+            "addmeal": self.cmd_addmeal,
+            "addspike": self.cmd_addspike_interactive,
+            "bypass": self.cmd_bypass,
+            "analyze": self.cmd_analyze,
+            "stats": self.cmd_stats,
+            "help": self.cmd_help,
+            "quit": self.cmd_quit,
+            "exit": self.cmd_quit,
+            "q": self.cmd_quit,
+            "compare": self.cmd_compare_profiles,
+            "similar": self.cmd_find_similar,
+            "timeline": self.cmd_timeline,
+            "timeline-range": self.cmd_timeline_range,
+            "overview": self.cmd_overview,
+            "today": self.cmd_today,
+        }
+        self._subcommands = {
+            "group": ({
+                "start": self.cmd_group_start,
+                "end": self.cmd_group_end,
+            }, "[ERROR] Unknown group command. Use 'group start' or 'group end'"),
+            "list": ({
+                "meals": self.cmd_list_meals,
+                "groups": self.cmd_list_groups,
+                "spikes": self.cmd_list_spikes,
+                "matches": self.cmd_list_matches,
+                "unmatched": self.cmd_list_unmatched,
+                "profiles": self.cmd_list_profiles,
+            }, "[ERROR] Unknown list command. Use 'list meals', 'list groups', 'list spikes', 'list matches', 'list unmatched', or 'list profiles'"),
+            "chart": ({
+                "spike": self.cmd_chart_spike,
+                "group": self.cmd_chart_group,
+                "compare": self.cmd_chart_compare,
+                "scatter": self.cmd_chart_scatter,
+            }, "[ERROR] Unknown chart command. Use 'chart spike', 'chart group', 'chart compare', or 'chart scatter'"),
+            "compare": ({"groups": self.cmd_compare_groups}, self.cmd_compare_profiles),
+            "analyze": ({"group": self.cmd_analyze_group}, self.cmd_analyze),
+        }
+        
+        # Range indexes for list filters, keyed by name; each is rebuilt
+        # when analyze replaces the list it was built from
+        self._range_indexes = {}
+    
+    def _range_index(self, name, items, key_fn):
+        """
+        Get a range index over items, building it if items changed
+        
+        Args:
+            name: Cache slot name
+            items: List of items to index
+            key_fn: Function returning an item's sort key
+            
+        Returns:
+            _RangeIndex over items
+        """
+        index = self._range_indexes.get(name)
+        if index is None or index.items is not items:
+            index = _RangeIndex(items, [key_fn(item) for item in items])
+            self._range_indexes[name] = index
+        return index
     
     def parse_timestamp(self, ts_str):
         """
@@ -32,7 +258,7 @@ class CLI:
             datetime object or None if invalid
         """
         try:
-            return datetime.strptime(ts_str, "%Y-%m-%d:%H:%M")
+            return parse_timestamp(ts_str)
         except ValueError:
             print("[ERROR] Invalid timestamp format. Use: YYYY-MM-DD:HH:MM")
             return None
@@ -54,7 +280,7 @@ class CLI:
         if not self.parse_timestamp(timestamp_str):
             return
         
-        self.analyzer.data_manager.add_meal(timestamp_str, gl)
+        self.data_manager.add_meal(timestamp_str, gl)
         print(f"[OK] Meal added: {timestamp_str}, GL={gl}")
     
     def cmd_group_start(self, args):
@@ -64,19 +290,19 @@ class CLI:
             return
         
         timestamp_str = args[0]
-        description = ' '.join(args[1:]).strip('"')
+        description = ' '.join(args[1:])
         
         # Validate timestamp
         if not self.parse_timestamp(timestamp_str):
             return
         
         # Check if there's an open group
-        open_group = self.analyzer.data_manager.get_open_group()
+        open_group = self.data_manager.get_open_group()
         if open_group:
             print(f"[ERROR] Group '{open_group['description']}' is still open. Use 'group end' first.")
             return
         
-        self.analyzer.data_manager.start_group(timestamp_str, description)
+        self.data_manager.start_group(timestamp_str, description)
         print(f"[OK] New group started: {description}")
     
     def cmd_group_end(self, args):
@@ -91,7 +317,7 @@ class CLI:
         if not self.parse_timestamp(timestamp_str):
             return
         
-        group = self.analyzer.data_manager.end_group(timestamp_str)
+        group = self.data_manager.end_group(timestamp_str)
         if group:
             print(f"[OK] Group '{group['description']}' closed at {timestamp_str}")
         else:
@@ -104,26 +330,28 @@ class CLI:
             return
         
         timestamp_str = args[0]
-        reason = ' '.join(args[1:]).strip('"')
+        reason = ' '.join(args[1:])
         
         # Validate timestamp
         if not self.parse_timestamp(timestamp_str):
             return
         
-        self.analyzer.data_manager.add_bypass(timestamp_str, reason)
+        self.data_manager.add_bypass(timestamp_str, reason)
         print(f"[OK] Spike at {timestamp_str} bypassed: {reason}")
     
     def cmd_analyze(self, args):
-        """Run analysis: analyze [--auto]"""
+        """Run analysis: analyze [--auto] [--quiet]"""
         # Check for --auto flag
         auto_mode = '--auto' in args
+        # --quiet skips formatting the per-spike and per-match details
+        verbose = False if '--quiet' in args else None
         
         if auto_mode:
             print("[INFO] Running AUTO spike detection (legacy mode)...")
         else:
             print("[INFO] Using manual spikes from spikes_manual.json...")
         
-        success = self.analyzer.run_analysis(auto=auto_mode)
+        success = self.analyzer.run_analysis(auto=auto_mode, verbose=verbose)
         
         if not success and not auto_mode:
             print("\n[TIP] Define spikes with: addspike YYYY-MM-DD")
@@ -216,87 +444,104 @@ class CLI:
         start = args[0] if len(args) > 0 else None
         end = args[1] if len(args) > 1 else None
         
-        meals = self.analyzer.data_manager.get_meals(start, end)
+        # Reject malformed filters instead of silently comparing them as strings;
+        # bare dates stay valid and filter by prefix as before
+        try:
+            for bound in args[:2]:
+                _parse_range_bound(bound)
+        except ValueError:
+            print("[ERROR] Invalid date format. Use YYYY-MM-DD or YYYY-MM-DD:HH:MM")
+            return
+        
+        meals = self.data_manager.get_meals(start, end)
         if not meals:
             print("No meals found")
             return
         
-        print(f"\nMeals ({len(meals)} total):")
-        print("-" * 50)
-        for meal in meals:
-            print(f"  {meal['timestamp']}  GL={meal['gl']}")
+        lines = [f"\nMeals ({len(meals)} total):", _SEP_DASH_50]
+        lines.extend(f"  {meal['timestamp']}  GL={meal['gl']}" for meal in meals)
+        print("\n".join(lines))
     
     def cmd_list_groups(self, args):
         """List all groups"""
-        groups = self.analyzer.data_manager.data["groups"]
+        groups = self.data_manager.data["groups"]
         if not groups:
             print("No groups defined")
             return
         
-        print(f"\nAnalysis Groups ({len(groups)} total):")
-        print("-" * 70)
+        lines = [f"\nAnalysis Groups ({len(groups)} total):", _SEP_DASH_70]
+        p = lines.append
         for i, group in enumerate(groups):
             end_str = group['end'] if group['end'] else "OPEN"
-            print(f"  {i+1}: {group['start']} to {end_str}")
-            print(f"     {group['description']}")
+            p(f"  {i+1}: {group['start']} to {end_str}")
+            p(f"     {group['description']}")
+        print("\n".join(lines))
     
     def cmd_list_spikes(self, args):
         """List manually defined spikes"""
-        json_path = Path(self.analyzer.config.get('data_files', 'spikes_manual_json'))
+        json_path = self.analyzer.manual_spikes_path
         
         if not json_path.exists():
             print("[INFO] No manual spikes defined yet.")
             print("[TIP] Use 'addspike YYYY-MM-DD' to add spikes interactively.")
             return
         
+        from glucose_analyzer.analysis.spike_manual import read_manual_spikes
+        
         try:
-            with open(json_path, 'r') as f:
-                spikes = json.load(f)
-            
-            if not spikes:
-                print("[INFO] No manual spikes defined yet.")
-                return
-            
-            # Parse date range if provided
+            # Parse date range if provided, before reading the file
             start_filter = None
             end_filter = None
             if len(args) >= 1:
                 try:
-                    start_filter = datetime.strptime(args[0], '%Y-%m-%d')
+                    start_filter = _parse_date(args[0])
                 except ValueError:
                     print("[ERROR] Invalid start date format. Use YYYY-MM-DD")
                     return
             if len(args) >= 2:
                 try:
-                    end_filter = datetime.strptime(args[1], '%Y-%m-%d')
+                    end_filter = _parse_date(args[1])
                 except ValueError:
                     print("[ERROR] Invalid end date format. Use YYYY-MM-DD")
                     return
             
-            # Filter spikes by date range
+            spikes = read_manual_spikes(json_path)
+            
+            if not spikes:
+                print("[INFO] No manual spikes defined yet.")
+                return
+            
+            # Filter spikes by date range, keeping the parsed start for display.
+            # The editor saves spikes sorted by start, but hand-edited or older
+            # files may not be, so sort before stopping at the first one past
+            # the end of the range.
+            by_start = sorted(((_iso_to_dt(spike['start']), spike) for spike in spikes),
+                              key=lambda item: item[0])
             filtered_spikes = []
-            for spike in spikes:
-                start_time = datetime.fromisoformat(spike['start'])
+            for start_time, spike in by_start:
                 if start_filter and start_time < start_filter:
                     continue
                 if end_filter and start_time > end_filter:
-                    continue
-                filtered_spikes.append(spike)
+                    break
+                filtered_spikes.append((start_time, spike))
             
             if not filtered_spikes:
                 print("[INFO] No spikes found in specified date range.")
                 return
             
-            print(f"\nManually Defined Spikes ({len(filtered_spikes)} total):")
-            print("=" * 80)
+            lines = []
+            p = lines.append
+            p(f"\nManually Defined Spikes ({len(filtered_spikes)} total):")
+            p(_SEP_EQ_80)
             
-            for i, spike in enumerate(filtered_spikes, 1):
-                start = datetime.fromisoformat(spike['start'])
-                end = datetime.fromisoformat(spike['end'])
+            for i, (start, spike) in enumerate(filtered_spikes, 1):
+                end = _iso_to_dt(spike['end'])
                 duration = (end - start).total_seconds() / 60
                 
-                print(f"\nSpike {i}: {start.strftime('%Y-%m-%d %H:%M')} to {end.strftime('%H:%M')}")
-                print(f"  Duration: {duration:.0f} minutes")
+                p(f"\nSpike {i}: {start.year:04d}-{start.month:02d}-{start.day:02d} "
+                  f"{start.hour:02d}:{start.minute:02d} to {end.hour:02d}:{end.minute:02d}")
+                p(f"  Duration: {duration:.0f} minutes")
+            print("\n".join(lines))
         
         except Exception as e:
             print(f"[ERROR] Failed to load manual spikes: {e}")
@@ -307,48 +552,59 @@ class CLI:
             print("No matches yet. Run 'analyze' first.")
             return
         
-        start_filter = args[0] if len(args) > 0 else None
-        end_filter = args[1] if len(args) > 1 else None
+        # Compare spike start times as datetimes, like list spikes
+        try:
+            start_filter = _parse_range_bound(args[0]) if len(args) > 0 else None
+            end_filter = _parse_range_bound(args[1]) if len(args) > 1 else None
+        except ValueError:
+            print("[ERROR] Invalid date format. Use YYYY-MM-DD or YYYY-MM-DD:HH:MM")
+            return
         
         matches = self.analyzer.match_results['matched']
         
-        # Filter by date range if provided
+        # Filter by date range if provided, as a binary search over spike starts
         if start_filter or end_filter:
-            matches = self.analyzer.meal_matcher.filter_matches_by_date(
-                matches, start_filter, end_filter
+            index = self._range_index(
+                'matches', matches,
+                lambda m: m.spike.start_time if m.spike else datetime.min
             )
+            matches = index.in_range(start_filter, end_filter)
         
         if not matches:
             print("No matched events found")
             return
         
-        print(f"\nMeal-Spike Matches ({len(matches)} total):")
-        print("=" * 80)
+        lines = []
+        p = lines.append
+        p(f"\nMeal-Spike Matches ({len(matches)} total):")
+        p(_SEP_EQ_80)
         for i, match in enumerate(matches):
-            print(f"\nMatch {i+1}:")
+            spike = match.spike
+            p(f"\nMatch {i+1}:")
             # Display meal(s) - handle single or multiple meals
             if match.meal_count == 1:
                 meal = match.meals[0]
                 delay = match.meal_delays[0]
-                print(f"  Meal:  {meal['timestamp']} (GL={meal['gl']})")
-                print(f"  Spike: {match.spike.start_time.strftime('%Y-%m-%d %H:%M')} "
-                      f"(+{delay:.0f} min delay)")
+                p(f"  Meal:  {meal['timestamp']} (GL={meal['gl']})")
+                p(f"  Spike: {spike.start_str} "
+                  f"(+{delay:.0f} min delay)")
             else:
-                print(f"  Meals: {match.meal_count} contributing meals (total GL={match.total_gl})")
+                p(f"  Meals: {match.meal_count} contributing meals (total GL={match.total_gl})")
                 for j, meal in enumerate(match.meals):
                     delay = match.meal_delays[j]
-                    print(f"    {j+1}. {meal['timestamp']} (GL={meal['gl']}, +{delay:.0f} min before spike)")
-                print(f"  Spike: {match.spike.start_time.strftime('%Y-%m-%d %H:%M')}")
+                    p(f"    {j+1}. {meal['timestamp']} (GL={meal['gl']}, +{delay:.0f} min before spike)")
+                p(f"  Spike: {spike.start_str}")
             
             # Display spike details
-            print(f"  Peak:  {match.spike.peak_time.strftime('%H:%M')} at {match.spike.peak_glucose:.0f} mg/dL "
-                  f"(+{match.spike.magnitude:.0f} mg/dL)")
-            print(f"  AUC-relative: {match.spike.auc_relative:.0f} mg/dL*min, Normalized: {match.spike.normalized_auc:.3f}")
-            if match.spike.recovery_time:
-                print(f"  Recovery: {match.spike.recovery_time:.0f} minutes")
-            print(f"  End:   {match.spike.end_time.strftime('%H:%M')} at {match.spike.end_glucose:.0f} mg/dL")
-            print(f"  Duration: {match.spike.duration_minutes:.0f} minutes")
-   
+            p(f"  Peak:  {spike.peak_hm} at {spike.peak_glucose:.0f} mg/dL "
+              f"(+{spike.magnitude:.0f} mg/dL)")
+            p(f"  AUC-relative: {spike.auc_relative:.0f} mg/dL*min, Normalized: {spike.normalized_auc:.3f}")
+            if spike.recovery_time:
+                p(f"  Recovery: {spike.recovery_time:.0f} minutes")
+            p(f"  End:   {spike.end_hm} at {spike.end_glucose:.0f} mg/dL")
+            p(f"  Duration: {spike.duration_minutes:.0f} minutes")
+        print("\n".join(lines))
+
     def cmd_list_unmatched(self, args):
         """List unmatched spikes and meals"""
         if not self.analyzer.match_results:
@@ -358,52 +614,63 @@ class CLI:
         unmatched_spikes = self.analyzer.match_results['unmatched_spikes']
         unmatched_meals = self.analyzer.match_results['unmatched_meals']
         
+        lines = []
+        p = lines.append
+        
         if unmatched_spikes:
-            print(f"\nUnmatched Spikes ({len(unmatched_spikes)} total):")
-            print("=" * 80)
-            print("These spikes have no associated meal - possible unexplained events")
-            print()
-            for i, spike in enumerate(unmatched_spikes):
-                print(f"{i+1}. {spike.start_time.strftime('%Y-%m-%d %H:%M')} - "
-                      f"Peak: {spike.peak_glucose:.0f} mg/dL (+{spike.magnitude:.0f} mg/dL), "
-                      f"Duration: {spike.duration_minutes:.0f} min")
+            p(f"\nUnmatched Spikes ({len(unmatched_spikes)} total):")
+            p(_SEP_EQ_80)
+            p("These spikes have no associated meal - possible unexplained events")
+            p("")
+            lines.extend(
+                f"{i}. {spike.start_str} - "
+                f"Peak: {spike.peak_glucose:.0f} mg/dL (+{spike.magnitude:.0f} mg/dL), "
+                f"Duration: {spike.duration_minutes:.0f} min"
+                for i, spike in enumerate(unmatched_spikes, 1)
+            )
         else:
-            print("\n[OK] No unmatched spikes - all spikes have associated meals")
+            p("\n[OK] No unmatched spikes - all spikes have associated meals")
         
         if unmatched_meals:
-            print(f"\nUnmatched Meals ({len(unmatched_meals)} total):")
-            print("=" * 80)
-            print("These meals did not trigger detectable spikes")
-            print()
-            for i, meal in enumerate(unmatched_meals):
-                print(f"{i+1}. {meal['timestamp']} - GL={meal['gl']}")
+            p(f"\nUnmatched Meals ({len(unmatched_meals)} total):")
+            p(_SEP_EQ_80)
+            p("These meals did not trigger detectable spikes")
+            p("")
+            lines.extend(
+                f"{i}. {meal['timestamp']} - GL={meal['gl']}"
+                for i, meal in enumerate(unmatched_meals, 1)
+            )
         else:
-            print("\n[OK] No unmatched meals - all meals have associated spikes")
+            p("\n[OK] No unmatched meals - all meals have associated spikes")
+        print("\n".join(lines))
     
     def cmd_stats(self, args):
         """Show CGM data statistics"""
         if self.analyzer.cgm_data is None:
             print("[ERROR] No CGM data loaded")
-            csv_path = self.analyzer.config.get('data_files', 'libreview_csv')
+            csv_path = self.analyzer.csv_path
             print(f"[INFO] Place LibreView CSV at: {csv_path}")
             return
         
         stats = self.analyzer.cgm_parser.get_stats()
         
-        print("\nCGM Data Statistics:")
-        print("=" * 60)
-        print(f"Date range: {stats['start_date']} to {stats['end_date']}")
-        print(f"Duration: {stats['days_of_data']} days")
-        print(f"\nRecord counts:")
-        print(f"  Total records: {stats['total_records']}")
-        print(f"  Type 0 (automatic): {stats['type_0_count']}")
-        print(f"  Type 1 (scan): {stats['type_1_count']}")
-        print(f"  Type 6 (events): {stats['type_6_count']}")
-        print(f"\nGlucose statistics:")
-        print(f"  Mean: {stats['mean_glucose']:.1f} mg/dL")
-        print(f"  Min: {stats['min_glucose']:.0f} mg/dL")
-        print(f"  Max: {stats['max_glucose']:.0f} mg/dL")
-        print(f"  Range: {stats['max_glucose'] - stats['min_glucose']:.0f} mg/dL")
+        lines = [
+            "\nCGM Data Statistics:",
+            _SEP_EQ_60,
+            f"Date range: {stats['start_date']} to {stats['end_date']}",
+            f"Duration: {stats['days_of_data']} days",
+            "\nRecord counts:",
+            f"  Total records: {stats['total_records']}",
+            f"  Type 0 (automatic): {stats['type_0_count']}",
+            f"  Type 1 (scan): {stats['type_1_count']}",
+            f"  Type 6 (events): {stats['type_6_count']}",
+            "\nGlucose statistics:",
+            f"  Mean: {stats['mean_glucose']:.1f} mg/dL",
+            f"  Min: {stats['min_glucose']:.0f} mg/dL",
+            f"  Max: {stats['max_glucose']:.0f} mg/dL",
+            f"  Range: {stats['max_glucose'] - stats['min_glucose']:.0f} mg/dL"
+        ]
+        print("\n".join(lines))
     
     def cmd_list_profiles(self, args):
         """List normalized profiles: list profiles [start] [end]"""
@@ -411,83 +678,70 @@ class CLI:
             print("No normalized profiles yet. Run 'analyze' first.")
             return
         
-        start_filter = args[0] if len(args) > 0 else None
-        end_filter = args[1] if len(args) > 1 else None
-        
         profiles = self.analyzer.normalized_profiles
         
-        # Filter by date range if provided
-        if start_filter or end_filter:
-            filtered = []
-            for profile in profiles:
-                if start_filter and profile.spike_start_time < start_filter:
-                    continue
-                if end_filter and profile.spike_start_time > end_filter:
-                    continue
-                filtered.append(profile)
-            profiles = filtered
+        # Filter by date range if provided, comparing parsed times since
+        # profile start times are ISO strings unlike the entered bounds
+        if args:
+            try:
+                bounds = [_parse_range_bound(arg) for arg in args[:2]]
+            except ValueError:
+                print("[ERROR] Invalid date format. Use YYYY-MM-DD or YYYY-MM-DD:HH:MM")
+                return
+            profiles = self.analyzer.profiles_in_range(*bounds)
         
         if not profiles:
             print("No profiles found in specified range")
             return
         
-        print(f"\nNormalized Spike Profiles ({len(profiles)} total):")
-        print("=" * 80)
+        lines = []
+        p = lines.append
+        p(f"\nNormalized Spike Profiles ({len(profiles)} total):")
+        p(_SEP_EQ_80)
         for i, profile in enumerate(profiles):
-            print(f"\nProfile {i+1}:")
-            print(f"  Spike: {profile.spike_start_time}")
+            p(f"\nProfile {i+1}:")
+            p(f"  Spike: {profile.spike_start_time}")
             if profile.meal_timestamp:
-                print(f"  Meal: {profile.meal_timestamp} (GL={profile.glycemic_load})")
-            print(f"  Duration: {profile.duration_minutes:.0f} minutes")
-            print(f"  Baseline: {profile.original_baseline:.0f} mg/dL")
-            print(f"  Peak: {profile.original_peak:.0f} mg/dL")
-            print(f"  Magnitude: {profile.original_magnitude:.0f} mg/dL")
-            print(f"  Data points: {len(profile.timestamps_minutes)}")
+                p(f"  Meal: {profile.meal_timestamp} (GL={profile.glycemic_load})")
+            p(f"  Duration: {profile.duration_minutes:.0f} minutes")
+            p(f"  Baseline: {profile.original_baseline:.0f} mg/dL")
+            p(f"  Peak: {profile.original_peak:.0f} mg/dL")
+            p(f"  Magnitude: {profile.original_magnitude:.0f} mg/dL")
+            p(f"  Data points: {len(profile.timestamps_minutes)}")
+        print("\n".join(lines))
 
-    def cmd_compare_groups(self, args):
+    def cmd_compare_profiles(self, args):
         """Compare normalized profiles between groups: compare "group1" "group2" """
         if len(args) < 2:
             print("[ERROR] Usage: compare \"group1 description\" \"group2 description\"")
             print("Example: compare \"baseline\" \"after medication\"")
             return
         
-        # Parse group descriptions - simple approach: split args in half
-        # Better approach: user passes quoted strings
-        group1_desc = args[0].strip('"')
-        group2_desc = args[1].strip('"')
+        # Quoted descriptions arrive as single args
+        group1_desc = args[0]
+        group2_desc = args[1]
         
         if not self.analyzer.normalized_profiles:
             print("[ERROR] No normalized profiles available. Run 'analyze' first.")
             return
         
-        # Get all groups
-        groups = self.analyzer.data_manager.data["groups"]
-        
         # Find the two groups
-        group1 = None
-        group2 = None
-        
-        for g in groups:
-            if g['description'] == group1_desc:
-                group1 = g
-            if g['description'] == group2_desc:
-                group2 = g
+        group1 = self.analyzer.find_group(group1_desc)
+        group2 = self.analyzer.find_group(group2_desc)
         
         if not group1 or not group2:
-            print(f"[ERROR] Could not find one or both groups")
-            print(f"Available groups:")
-            for g in groups:
+            print("[ERROR] Could not find one or both groups")
+            print("Available groups:")
+            for g in self.analyzer.groups:
                 print(f"  - \"{g['description']}\"")
             return
         
         # Filter profiles by group date ranges
-        group1_profiles = [p for p in self.analyzer.normalized_profiles
-                        if group1['start'] <= p.spike_start_time <= (group1['end'] or '9999-12-31')]
-        group2_profiles = [p for p in self.analyzer.normalized_profiles
-                        if group2['start'] <= p.spike_start_time <= (group2['end'] or '9999-12-31')]
+        group1_profiles = self.analyzer.profiles_in_group(group1)
+        group2_profiles = self.analyzer.profiles_in_group(group2)
         
         if not group1_profiles or not group2_profiles:
-            print(f"[ERROR] One or both groups have no normalized profiles")
+            print("[ERROR] One or both groups have no normalized profiles")
             print(f"Group 1 \"{group1_desc}\": {len(group1_profiles)} profiles")
             print(f"Group 2 \"{group2_desc}\": {len(group2_profiles)} profiles")
             return
@@ -496,8 +750,8 @@ class CLI:
         comparison = self.analyzer.normalizer.compare_groups(group1_profiles, group2_profiles)
         
         # Display results
-        print(f"\nGroup Comparison:")
-        print("=" * 80)
+        print("\nGroup Comparison:")
+        print(_SEP_EQ_80)
         
         print(f"\nGroup 1: \"{group1_desc}\"")
         print(f"  Date range: {group1['start']} to {group1['end']}")
@@ -516,7 +770,7 @@ class CLI:
             print(f"  Avg GL: {comparison['group2']['avg_gl']:.1f} ± {comparison['group2']['std_gl']:.1f}")
         
         if 'improvement' in comparison:
-            print(f"\nChange (Group 2 vs Group 1):")
+            print("\nChange (Group 2 vs Group 1):")
             print(f"  Duration: {comparison['improvement']['duration_change_min']:+.0f} min "
                 f"({comparison['improvement']['duration_pct_change']:+.1f}%)")
             print(f"  Magnitude: {comparison['improvement']['magnitude_change_mgdl']:+.0f} mg/dL "
@@ -524,14 +778,14 @@ class CLI:
             
             # Interpret results
             if comparison['improvement']['duration_pct_change'] < -5:
-                print(f"\n  ✓ Improved: Shorter spike duration")
+                print("\n  ✓ Improved: Shorter spike duration")
             elif comparison['improvement']['duration_pct_change'] > 5:
-                print(f"\n  ⚠ Longer: Spike duration increased")
+                print("\n  ⚠ Longer: Spike duration increased")
             
             if comparison['improvement']['magnitude_pct_change'] < -5:
-                print(f"  ✓ Improved: Lower spike magnitude")
+                print("  ✓ Improved: Lower spike magnitude")
             elif comparison['improvement']['magnitude_pct_change'] > 5:
-                print(f"  ⚠ Higher: Spike magnitude increased")
+                print("  ⚠ Higher: Spike magnitude increased")
 
     def cmd_find_similar(self, args):
         """Find spikes with similar shapes: similar <spike_index> [threshold]"""
@@ -580,11 +834,14 @@ class CLI:
             print(f"Try lowering threshold, e.g.: similar {spike_idx + 1} 0.7")
             return
         
+        # Position of each profile in the original list, by identity (profiles
+        # hold arrays, so list.index equality checks are both slow and unreliable)
+        position = {id(p): i for i, p in enumerate(self.analyzer.normalized_profiles)}
+        
         print(f"\nSimilar Spikes ({len(similar)} found, threshold={threshold:.2f}):")
-        print("=" * 80)
+        print(_SEP_EQ_80)
         for i, (profile, similarity) in enumerate(similar):
-            # Find index in original list
-            profile_idx = self.analyzer.normalized_profiles.index(profile) + 1
+            profile_idx = position[id(profile)] + 1
             
             print(f"\n{i+1}. Profile #{profile_idx} - Similarity: {similarity:.3f}")
             print(f"   Time: {profile.spike_start_time}")
@@ -596,38 +853,7 @@ class CLI:
 
     def cmd_help(self, args):
         """Show help"""
-        print("""
-  addmeal <timestamp> <gl>           Add meal entry
-  addspike <yyyy-mm-dd>              Add spike interactively (click start/end on chart)
-  group start <timestamp> <desc>     Start new analysis group
-  group end <timestamp>              Close current group
-  bypass <timestamp> <reason>        Mark spike as bypassed
-  analyze                            Analyze using manual spikes (default)
-  analyze --auto                     Analyze using auto spike detection (legacy)
-  analyze group <n>                  Analyze single group
-  analyze group <n> --gl-range X-Y   Analyze group with GL filter
-  compare groups <n1> <n2>           Compare two groups
-  compare groups <n1> <n2> --gl-range X-Y   Compare with GL filter
-  list meals [start] [end]           List meals in date range
-  list groups                        Show all groups
-  list spikes [start] [end]          List manually defined spikes
-  list matches [start] [end]         List meal-spike matches
-  list unmatched                     Show unmatched spikes and meals
-  list profiles [start] [end]        List normalized spike profiles
-  compare "group1" "group2"          Compare normalized profiles between groups
-  similar <spike_idx> [threshold]    Find spikes with similar shapes (threshold: 0.0-1.0)
-  stats                              Show CGM data statistics
-  chart spike <n> [--normalize]      Chart individual spike
-  chart group <n> [--normalize]      Chart group overlay
-  chart compare <n1> <n2> [--normalize]  Chart group comparison
-  chart scatter <n>                  Chart GL vs AUC scatter
-  timeline <date>                    24-hour chart for specific date
-  timeline-range <start> <end>       Charts for date range
-  overview <start> <end>             Multi-day condensed overview
-  today                              Timeline for current date
-  help                               Show this help
-  quit                               Exit program
-        """)
+        print(_HELP_TEXT)
     
     def cmd_quit(self, args):
         """Exit program"""
@@ -641,7 +867,11 @@ class CLI:
         Args:
             line: Command line string
         """
-        parts = line.strip().split()
+        try:
+            parts = _split_command(line)
+        except ValueError:
+            print("[ERROR] Unmatched quote in command")
+            return
         if not parts:
             return
         
@@ -649,75 +879,20 @@ class CLI:
         args = parts[1:]
         
         # Handle multi-word commands
-        if cmd == "group" and len(args) > 0:
-            subcommand = args[0].lower()
-            if subcommand == "start":
-                self.cmd_group_start(args[1:])
-            elif subcommand == "end":
-                self.cmd_group_end(args[1:])
-            else:
-                print("[ERROR] Unknown group command. Use 'group start' or 'group end'")
-        elif cmd == "list" and len(args) > 0:
-            subcommand = args[0].lower()
-            if subcommand == "meals":
-                self.cmd_list_meals(args[1:])
-            elif subcommand == "groups":
-                self.cmd_list_groups(args[1:])
-            elif subcommand == "spikes":
-                self.cmd_list_spikes(args[1:])
-            elif subcommand == "matches":
-                self.cmd_list_matches(args[1:])
-            elif subcommand == "unmatched":
-                self.cmd_list_unmatched(args[1:])
-            elif subcommand == "profiles":
-                self.cmd_list_profiles(args[1:])
-            else:
-                print("[ERROR] Unknown list command. Use 'list meals', 'list groups', 'list spikes', 'list matches', 'list unmatched', or 'list profiles'")
-        elif cmd == "addmeal":
-            self.cmd_addmeal(args)
-        elif cmd == "addspike":
-            self.cmd_addspike_interactive(args)
-        elif cmd == "bypass":
-            self.cmd_bypass(args)
-        elif cmd == "analyze":
-            self.cmd_analyze(args)
-        elif cmd == "chart" and len(args) > 0:
-            subcommand = args[0].lower()
-            if subcommand == "spike":
-                self.cmd_chart_spike(args[1:])
-            elif subcommand == "group":
-                self.cmd_chart_group(args[1:])
-            elif subcommand == "compare":
-                self.cmd_chart_compare(args[1:])
-            elif subcommand == "scatter":
-                self.cmd_chart_scatter(args[1:])
-            else:
-                print("[ERROR] Unknown chart command. Use 'chart spike', 'chart group', 'chart compare', or 'chart scatter'")
-        elif cmd == "stats":
-            self.cmd_stats(args)
-        elif cmd == "help":
-            self.cmd_help(args)
-        elif cmd == "quit" or cmd == "exit" or cmd == "q":
-            self.cmd_quit(args)
-        elif cmd == "compare":
-            self.cmd_compare_groups(args)
-        elif cmd == "similar":
-            self.cmd_find_similar(args)
-        elif cmd == "analyze":
-            if len(args) > 0 and args[0].lower() == "group":
-                self.cmd_analyze_group(args[1:])  # NEW
+        if args and cmd in self._subcommands:
+            table, fallback = self._subcommands[cmd]
+            handler = table.get(args[0].lower())
+            if handler is not None:
+                handler(args[1:])
+            elif callable(fallback):
+                fallback(args)
             else:
-                self.cmd_analyze(args)
-        elif cmd == "compare" and len(args) > 0 and args[0].lower() == "groups":
-            self.cmd_compare_groups(args[1:])  # NEW
-        elif cmd == 'timeline':
-            self.cmd_timeline(args)
-        elif cmd == 'timeline-range':
-            self.cmd_timeline_range(args)
-        elif cmd == 'overview':
-            self.cmd_overview(args)
-        elif cmd == 'today':
-            self.cmd_today(args)
+                print(fallback)
+            return
+        
+        handler = self._commands.get(cmd)
+        if handler is not None:
+            handler(args)
         else:
             print(f"[ERROR] Unknown command: {cmd}. Type 'help' for commands.")
 
@@ -735,7 +910,7 @@ class CLI:
         
         # Validate date format
         try:
-            datetime.strptime(date_str, '%Y-%m-%d')
+            _parse_date(date_str)
         except ValueError:
             print("Invalid date format. Use YYYY-MM-DD")
             return
@@ -755,7 +930,7 @@ class CLI:
         chart_path = visualizer.plot_day_timeline(
             date=date_str,
             cgm_data=self.analyzer.cgm_data,
-            meals=self.analyzer.data_manager.get_meals(),
+            meals=self.data_manager.get_meals(),
             matches=self.analyzer.match_results['matched'],
             unmatched_spikes=self.analyzer.match_results['unmatched_spikes']
         )
@@ -781,8 +956,8 @@ class CLI:
         
         # Validate dates
         try:
-            datetime.strptime(start_date, '%Y-%m-%d')
-            datetime.strptime(end_date, '%Y-%m-%d')
+            _parse_date(start_date)
+            _parse_date(end_date)
         except ValueError:
             print("Invalid date format. Use YYYY-MM-DD")
             return
@@ -801,7 +976,7 @@ class CLI:
             start_date=start_date,
             end_date=end_date,
             cgm_data=self.analyzer.cgm_data,
-            meals=self.analyzer.data_manager.get_meals(),
+            meals=self.data_manager.get_meals(),
             matches=self.analyzer.match_results['matched'],
             unmatched_spikes=self.analyzer.match_results['unmatched_spikes']
         )
@@ -830,8 +1005,8 @@ class CLI:
         
         # Validate dates
         try:
-            datetime.strptime(start_date, '%Y-%m-%d')
-            datetime.strptime(end_date, '%Y-%m-%d')
+            _parse_date(start_date)
+            _parse_date(end_date)
         except ValueError:
             print("Invalid date format. Use YYYY-MM-DD")
             return
@@ -850,7 +1025,7 @@ class CLI:
             start_date=start_date,
             end_date=end_date,
             cgm_data=self.analyzer.cgm_data,
-            meals=self.analyzer.data_manager.get_meals(),
+            meals=self.data_manager.get_meals(),
             matches=self.analyzer.match_results['matched']
         )
         
@@ -881,7 +1056,7 @@ class CLI:
         chart_path = visualizer.plot_day_timeline(
             date=today,
             cgm_data=self.analyzer.cgm_data,
-            meals=self.analyzer.data_manager.get_meals(),
+            meals=self.data_manager.get_meals(),
             matches=self.analyzer.match_results['matched'],
             unmatched_spikes=self.analyzer.match_results['unmatched_spikes']
         )
@@ -979,32 +1154,82 @@ class CLI:
         
         # Validate date format
         try:
-            from datetime import datetime
-            datetime.strptime(date_str, '%Y-%m-%d')
+            _parse_date(date_str)
         except ValueError:
             print("[ERROR] Invalid date format. Use YYYY-MM-DD")
             return
         
-        csv_path = Path(self.analyzer.config.get('data_files', 'libreview_csv'))
-        json_path = Path(self.analyzer.config.get('data_files', 'spikes_manual_json'))
+        csv_path = Path(self.analyzer.csv_path)
+        json_path = self.analyzer.manual_spikes_path
         
         if not csv_path.exists():
             print(f"[ERROR] CGM data file not found: {csv_path}")
             return
         
+        from glucose_analyzer.analysis.spike_manual import add_spike_interactive
+        
         try:
             add_spike_interactive(date_str, csv_path, json_path)
         except Exception as e:
             print(f"[ERROR] Failed to add spike: {e}")
 
+    def _complete(self, text, state):
+        """
+        readline completer for command and subcommand names
+        
+        Args:
+            text: Word being completed
+            state: Index of the candidate to return
+            
+        Returns:
+            str: Matching candidate, or None when exhausted
+        """
+        import readline
+        
+        words = readline.get_line_buffer()[:readline.get_begidx()].split()
+        if not words:
+            candidates = sorted(set(self._commands) | set(self._subcommands))
+        elif len(words) == 1 and words[0].lower() in self._subcommands:
+            candidates = sorted(self._subcommands[words[0].lower()][0])
+        else:
+            candidates = []
+        
+        matches = [c for c in candidates if c.startswith(text)]
+        return matches[state] if state < len(matches) else None
+    
+    def _setup_readline(self):
+        """
+        Enable tab completion and load saved history for interactive sessions
+        
+        Returns:
+            module: The readline module, or None if unavailable
+        """
+        try:
+            import readline
+        except ImportError:
+            return None
+        
+        readline.parse_and_bind("tab: complete")
+        # Split words on whitespace only, so hyphenated commands such as
+        # timeline-range and timestamp arguments complete as whole words
+        readline.set_completer_delims(' \t\n')
+        readline.set_completer(self._complete)
+        readline.set_history_length(_HISTORY_LENGTH)
+        try:
+            readline.read_history_file(_HISTORY_PATH)
+        except OSError:
+            pass
+        return readline
+    
     def run(self):
         """Main CLI loop"""
         print("Glucose Spike Analyzer v1.0")
         
         # Load stats
-        meals_count = len(self.analyzer.data_manager.data["meals"])
-        groups_count = len(self.analyzer.data_manager.data["groups"])
-        bypassed_count = len(self.analyzer.data_manager.data["bypassed_spikes"])
+        data = self.data_manager.data
+        meals_count = len(data["meals"])
+        groups_count = len(data["groups"])
+        bypassed_count = len(data["bypassed_spikes"])
         
         print(f"Loaded {meals_count} meals, {groups_count} groups, {bypassed_count} bypassed spikes")
         
@@ -1013,23 +1238,43 @@ class CLI:
             cgm_count = len(self.analyzer.cgm_data)
             print(f"CGM data: {cgm_count} readings loaded")
         else:
-            csv_path = self.analyzer.config.get('data_files', 'libreview_csv')
+            csv_path = self.analyzer.csv_path
             print(f"[WARNING] No CGM data loaded. Place LibreView CSV at: {csv_path}")
         
         print("Type 'help' for commands\n")
         
+        # Piped or file input is read straight from the block-buffered stdin;
+        # input() is kept for terminals so line editing works
+        interactive = sys.stdin.isatty()
+        readline = self._setup_readline() if interactive else None
+        
         while self.running:
             try:
-                line = input("> ")
-                self.process_command(line)
+                if interactive:
+                    line = input("> ")
+                else:
+                    sys.stdout.write("> ")
+                    line = sys.stdin.readline()
+                    if not line:
+                        break
+                self.process_command(line.rstrip('\n'))
             except KeyboardInterrupt:
                 print("\nUse 'quit' to exit")
             except EOFError:
                 break
+        
+        if readline is not None:
+            try:
+                readline.write_history_file(_HISTORY_PATH)
+            except OSError:
+                print(f"[WARNING] Could not save command history to {_HISTORY_PATH}")
 
 
 def main():
     """Application entry point"""
+    # Imported here so loading the CLI module doesn't pull in numpy/pandas
+    from glucose_analyzer.analyzer import GlucoseAnalyzer
+    
     analyzer = GlucoseAnalyzer()
     cli = CLI(analyzer)
     cli.run()
@@ -35,6 +35,7 @@ class LibreViewParser:
         self.metadata = {}
         self.data = None
         self._raw_df = None
+        self._stats = None
     
     def parse(self):
         """
@@ -62,6 +63,7 @@ class LibreViewParser:
         
         # Parse and clean the data
         self.data = self._process_data()
+        self._stats = None
         
         return self.data
     
@@ -168,6 +170,9 @@ class LibreViewParser:
         if self.data is None:
             raise ValueError("No data loaded. Call parse() first.")
         
+        if self._stats is not None:
+            return self._stats
+        
         start_date, end_date = self.get_date_range()
         
         stats = {
@@ -183,6 +188,7 @@ class LibreViewParser:
             'max_glucose': self.data['glucose'].max()
         }
         
+        self._stats = stats
         return stats
 
 
@@ -2,6 +2,7 @@
 
 import json
 import os
+from bisect import bisect_left, bisect_right
 
 
 class DataManager:
@@ -16,6 +17,10 @@ class DataManager:
         """
         self.filepath = filepath
         self.data = self._load()
+        
+        # Meals sorted by timestamp, rebuilt lazily after each save
+        self._sorted_meals = None
+        self._sorted_meal_timestamps = None
     
     def _load(self):
         """Load data from JSON file"""
@@ -29,6 +34,7 @@ class DataManager:
         """Save data to JSON file"""
         with open(self.filepath, 'w') as f:
             json.dump(self.data, f, indent=2)
+        self._sorted_meals = None
     
     def add_meal(self, timestamp, gl):
         """
@@ -116,12 +122,14 @@ class DataManager:
         Returns:
             list: Filtered and sorted meals
         """
-        meals = self.data["meals"]
-        if start:
-            meals = [m for m in meals if m["timestamp"] >= start]
-        if end:
-            meals = [m for m in meals if m["timestamp"] <= end]
-        return sorted(meals, key=lambda m: m["timestamp"])
+        if self._sorted_meals is None:
+            self._sorted_meals = sorted(self.data["meals"], key=lambda m: m["timestamp"])
+            self._sorted_meal_timestamps = [m["timestamp"] for m in self._sorted_meals]
+        
+        timestamps = self._sorted_meal_timestamps
+        lo = bisect_left(timestamps, start) if start else 0
+        hi = bisect_right(timestamps, end) if end else len(timestamps)
+        return self._sorted_meals[lo:hi]
     
     def get_open_group(self):
         """
@@ -0,0 +1,38 @@
+"""Parsing for the YYYY-MM-DD:HH:MM timestamps used by meals, groups and commands"""
+
+from datetime import datetime
+from functools import lru_cache
+import re
+
+# Timestamp format of meals, groups and user-entered times
+TIMESTAMP_FORMAT = "%Y-%m-%d:%H:%M"
+
+# Zero-padded form of the above, which can be sliced without strptime
+_TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2}:\d{2}:\d{2}', re.ASCII)
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(ts_str):
+    """
+    Parse a YYYY-MM-DD:HH:MM timestamp
+
+    Zero-padded input is sliced directly; anything else goes through
+    strptime so invalid input raises the usual ValueError.
+    Results are memoized per string (failed parses are not cached).
+
+    Args:
+        ts_str: Timestamp string
+
+    Returns:
+        datetime object
+
+    Raises:
+        ValueError: If ts_str is not a valid timestamp
+    """
+    if _TIMESTAMP_RE.fullmatch(ts_str):
+        try:
+            return datetime(int(ts_str[0:4]), int(ts_str[5:7]), int(ts_str[8:10]),
+                            int(ts_str[11:13]), int(ts_str[14:16]))
+        except ValueError:
+            pass
+    return datetime.strptime(ts_str, TIMESTAMP_FORMAT)
@@ -14,20 +14,24 @@ import os
 class ChartGenerator:
     """Generates charts for glucose analysis"""
     
-    def __init__(self, config):
+    def __init__(self, config, charts_dir=None):
         """
         Initialize chart generator
         
         Args:
             config: Config object with output settings
+            charts_dir: Output directory already created by the caller (optional)
         """
         self.config = config
-        self.output_dir = Path(config.get('output', 'charts_directory'))
         self.dpi = config.get('output', 'chart_dpi')
         self.auto_open = config.get('output', 'auto_open_charts')
         
-        # Create output directory if needed
-        self.output_dir.mkdir(exist_ok=True)
+        if charts_dir is not None:
+            self.output_dir = Path(charts_dir)
+        else:
+            self.output_dir = Path(config.get('output', 'charts_directory'))
+            # Create output directory if needed
+            self.output_dir.mkdir(exist_ok=True)
         
         # Set style
         plt.style.use('seaborn-v0_8-darkgrid')
@@ -0,0 +1,276 @@
+"""Tests for GlucoseAnalyzer caching and analysis"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from glucose_analyzer import analyzer as analyzer_module
+from glucose_analyzer.analyzer import GlucoseAnalyzer
+from glucose_analyzer.parsers.csv_parser import LibreViewParser
+
+TESTS_DIR = Path(__file__).parent
+REPO_CONFIG = TESTS_DIR.parent / 'config.json'
+
+
+class AnalyzerTestCase(unittest.TestCase):
+    """Analyzer over a copy of the test CSV, with caches in a temp directory"""
+
+    csv_name = 'test_data_with_spikes.csv'
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+
+        self.csv_path = root / 'libreview.csv'
+        shutil.copy(TESTS_DIR / self.csv_name, self.csv_path)
+        self.meals_path = root / 'meals.json'
+        self.meals_path.write_text(json.dumps({
+            "meals": [{"timestamp": "2025-11-14:06:00", "gl": 25}],
+            "groups": [],
+            "bypassed_spikes": []
+        }))
+        self.spikes_path = root / 'spikes_manual.json'
+
+        config = json.loads(REPO_CONFIG.read_text())
+        config['data_files'] = {
+            'libreview_csv': str(self.csv_path),
+            'meals_json': str(self.meals_path),
+            'spikes_manual_json': str(self.spikes_path)
+        }
+        config['output']['charts_directory'] = str(root / 'charts')
+        self.config_path = root / 'config.json'
+        self.config_path.write_text(json.dumps(config))
+
+        self.cache_dir = root / 'cache'
+        patcher = mock.patch.object(analyzer_module, 'CACHE_DIR', str(self.cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_analyzer(self):
+        """Create an analyzer on the temp config, discarding its output"""
+        with redirect_stdout(io.StringIO()):
+            return GlucoseAnalyzer(config_path=str(self.config_path), verbose=False)
+
+    def count_parses(self):
+        """Patch LibreViewParser.parse to count calls while still parsing"""
+        patcher = mock.patch.object(LibreViewParser, 'parse', autospec=True,
+                                    side_effect=LibreViewParser.parse)
+        parse = patcher.start()
+        self.addCleanup(patcher.stop)
+        return parse
+
+    def touch(self, path):
+        """Move a file's mtime forward so signature checks see a change"""
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class CGMCacheTest(AnalyzerTestCase):
+    """Parsed CSV cache reuse and invalidation"""
+
+    def test_unchanged_csv_reuses_cache(self):
+        self.make_analyzer()
+        parse = self.count_parses()
+
+        analyzer = self.make_analyzer()
+
+        self.assertEqual(parse.call_count, 0)
+        self.assertIsNotNone(analyzer.cgm_data)
+
+    def test_edited_csv_is_reparsed(self):
+        self.make_analyzer()
+        with open(self.csv_path, 'a') as f:
+            f.write("FreeStyle Libre 3,test-device-001,11-14-2025 11:55 PM,0,90"
+                    ",,,,,,,,,,,,,,\n")
+        self.touch(self.csv_path)
+        parse = self.count_parses()
+
+        self.make_analyzer()
+
+        self.assertEqual(parse.call_count, 1)
+
+    def test_other_version_is_ignored(self):
+        analyzer = self.make_analyzer()
+        cache_path = analyzer._cgm_cache_path(analyzer.csv_path)
+        with mock.patch.object(analyzer_module, 'CACHE_VERSION', analyzer_module.CACHE_VERSION + 1):
+            parse = self.count_parses()
+            self.make_analyzer()
+        self.assertEqual(parse.call_count, 1)
+        self.assertTrue(os.path.exists(cache_path))
+
+    def test_corrupt_cache_is_reported_and_reparsed(self):
+        analyzer = self.make_analyzer()
+        Path(analyzer._cgm_cache_path(analyzer.csv_path)).write_bytes(b'not a pickle')
+        parse = self.count_parses()
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            GlucoseAnalyzer(config_path=str(self.config_path), verbose=False)
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertIn("[WARNING] Ignoring unreadable CGM cache", out.getvalue())
+
+    def test_deleted_cache_dir_is_recreated(self):
+        analyzer = self.make_analyzer()
+        shutil.rmtree(self.cache_dir)
+
+        analyzer._save_cgm_cache(analyzer.csv_path, analyzer._cgm_key)
+
+        self.assertTrue(os.path.exists(analyzer._cgm_cache_path(analyzer.csv_path)))
+
+
+class AnalysisCacheTest(AnalyzerTestCase):
+    """Analysis result cache reuse and invalidation"""
+
+    def setUp(self):
+        super().setUp()
+        analyzer = self.make_analyzer()
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(analyzer.run_analysis(auto=True))
+        self.signature = analyzer._analysis_sig
+
+    def assert_not_reused(self):
+        analyzer = self.make_analyzer()
+        self.assertIsNone(analyzer._analysis_sig)
+        self.assertEqual(analyzer.detected_spikes, [])
+        self.assertNotEqual(analyzer._analysis_signature(True), self.signature)
+
+    def test_unchanged_inputs_reuse_results(self):
+        analyzer = self.make_analyzer()
+        self.assertEqual(analyzer._analysis_sig, self.signature)
+        self.assertTrue(analyzer.detected_spikes)
+
+    def test_changed_meal_invalidates(self):
+        data = json.loads(self.meals_path.read_text())
+        data['meals'][0]['gl'] = 30
+        self.meals_path.write_text(json.dumps(data))
+        self.assert_not_reused()
+
+    def test_changed_config_invalidates(self):
+        config = json.loads(self.config_path.read_text())
+        config['spike_detection']['pre_spike_meal_window'] += 30
+        self.config_path.write_text(json.dumps(config))
+        self.assert_not_reused()
+
+    def test_changed_cgm_file_invalidates(self):
+        self.touch(self.csv_path)
+        self.assert_not_reused()
+
+    def test_other_version_is_ignored(self):
+        with mock.patch.object(analyzer_module, 'CACHE_VERSION', analyzer_module.CACHE_VERSION + 1):
+            analyzer = self.make_analyzer()
+        self.assertIsNone(analyzer._analysis_sig)
+
+
+class ComputeAnalysisTest(AnalyzerTestCase):
+    """_compute_analysis results and their report lines"""
+
+    def setUp(self):
+        super().setUp()
+        self.meals_path.write_text(json.dumps({
+            "meals": [
+                {"timestamp": "2025-11-14:06:10", "gl": 25},
+                {"timestamp": "2025-11-14:10:00", "gl": 5},
+                {"timestamp": "2025-11-14:12:10", "gl": 10}
+            ],
+            "groups": [],
+            "bypassed_spikes": []
+        }))
+        self.spikes_path.write_text(json.dumps([
+            {"start": "2025-11-14T06:25:00", "end": "2025-11-14T08:05:00"},
+            {"start": "2025-11-14T12:15:00", "end": "2025-11-14T13:50:00"}
+        ]))
+        self.analyzer = self.make_analyzer()
+
+    def test_manual_spikes_result(self):
+        result = self.analyzer._compute_analysis()
+
+        self.assertTrue(result['success'])
+        self.assertFalse(result['auto'])
+        self.assertEqual(result['meal_count'], 3)
+        self.assertEqual([(s.peak_glucose, s.magnitude) for s in result['spikes']],
+                         [(168, 83), (163, 75)])
+
+        stats = result['match_stats']
+        self.assertEqual(stats['matched_count'], 2)
+        self.assertEqual(stats['unmatched_spikes'], 0)
+        self.assertEqual(stats['unmatched_meals'], 1)
+        self.assertEqual(stats['complex_events'], 0)
+        self.assertEqual((stats['min_delay'], stats['max_delay'], stats['avg_delay']), (5, 15, 10))
+        self.assertEqual(stats['avg_gl'], 17.5)
+        self.assertEqual(stats['avg_magnitude'], 79)
+        self.assertEqual(result['match_results']['unmatched_meals'],
+                         [{"timestamp": "2025-11-14:10:00", "gl": 5}])
+
+    def test_format_summary_lines(self):
+        lines = self.analyzer._format_analysis(self.analyzer._compute_analysis(), verbose=False)
+
+        self.assertEqual(lines[3:], [
+            "\n[INFO] Loading manual spikes from JSON...",
+            "[OK] Loaded 2 manual spike(s)",
+            "\n[INFO] Matching 3 meal(s) with 2 spike(s)...",
+            "\n[OK] Matched 2 meal(s) to spikes",
+            "\n[OK] 2 spike profiles available (normalized on first compare or chart)"
+        ])
+
+    def test_format_verbose_details(self):
+        lines = self.analyzer._format_analysis(self.analyzer._compute_analysis(), verbose=True)
+
+        self.assertIn("\nSpike 1: 2025-11-14 06:25 to 08:05", lines)
+        self.assertIn("  Duration: 100 min, Peak: 168 mg/dL (+83)", lines)
+        self.assertIn("  Meal: 2025-11-14:12:10 (GL=10)", lines)
+        self.assertIn("  Delay: 5 minutes", lines)
+
+    def test_no_manual_spikes(self):
+        self.spikes_path.write_text("[]")
+        result = self.analyzer._compute_analysis()
+
+        self.assertFalse(result['success'])
+        self.assertIsNone(result['match_stats'])
+        self.assertIn("[ERROR] No manual spikes found.", self.analyzer._format_analysis(result))
+
+
+    def run_analysis(self, analyzer, verbose):
+        """Run analysis and return its printed report"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertTrue(analyzer.run_analysis(verbose=verbose))
+        return out.getvalue()
+
+    def test_repeated_analysis_prints_same_report(self):
+        first = self.run_analysis(self.analyzer, verbose=True)
+        with mock.patch.object(self.analyzer, '_compute_analysis') as compute:
+            second = self.run_analysis(self.analyzer, verbose=True)
+
+        compute.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertIn("Matched Meal-Spike Pairs:", second)
+
+    def test_reused_analysis_honours_verbose(self):
+        quiet = self.run_analysis(self.analyzer, verbose=False)
+        self.run_analysis(self.analyzer, verbose=True)
+
+        self.assertEqual(self.run_analysis(self.analyzer, verbose=False), quiet)
+        self.assertNotIn("Matched Meal-Spike Pairs:", quiet)
+
+    def test_restored_analysis_prints_same_report(self):
+        first = self.run_analysis(self.analyzer, verbose=True)
+        restored = self.make_analyzer()
+        with mock.patch.object(restored, '_compute_analysis') as compute:
+            second = self.run_analysis(restored, verbose=True)
+
+        compute.assert_not_called()
+        self.assertEqual(second, first)
+
+
+if __name__ == '__main__':
+    unittest.main()
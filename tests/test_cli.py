@@ -0,0 +1,231 @@
+"""Tests for CLI command handling"""
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from glucose_analyzer.cli import CLI, _split_command
+from glucose_analyzer.utils.data_manager import DataManager
+from tests.test_analyzer import AnalyzerTestCase
+
+
+class SplitCommandTest(unittest.TestCase):
+    """Command line tokenizing"""
+
+    def test_plain_words(self):
+        self.assertEqual(_split_command("  list   meals\t2025-11-02 "), ["list", "meals", "2025-11-02"])
+
+    def test_quoted_description_keeps_spaces(self):
+        self.assertEqual(_split_command('group start "Low  carb week" 2025-11-01:00:00'),
+                         ["group", "start", "Low  carb week", "2025-11-01:00:00"])
+
+    def test_quotes_glue_adjacent_text(self):
+        self.assertEqual(_split_command('x a"b c"d y'), ["x", "ab cd", "y"])
+
+    def test_empty_quotes_are_a_word(self):
+        self.assertEqual(_split_command('a "" b'), ["a", "", "b"])
+
+    def test_apostrophes_and_backslashes_are_literal(self):
+        self.assertEqual(_split_command("note Mom's C:\\data"), ["note", "Mom's", "C:\\data"])
+
+    def test_unbalanced_quote_raises(self):
+        with self.assertRaises(ValueError):
+            _split_command('group start "Low carb')
+
+
+class ProcessCommandTest(unittest.TestCase):
+    """Command dispatch through the _commands and _subcommands tables"""
+
+    def make_cli(self, *handlers):
+        """Create a CLI with the named handler methods mocked out"""
+        mocks = {}
+        for name in handlers:
+            patcher = mock.patch.object(CLI, name)
+            mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        return CLI(SimpleNamespace(data_manager=None)), mocks
+
+    def run_command(self, cli, line):
+        """Run a command and return its printed output"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            cli.process_command(line)
+        return out.getvalue()
+
+    def test_top_level_command(self):
+        cli, mocks = self.make_cli('cmd_stats', 'cmd_quit')
+        self.run_command(cli, "STATS extra")
+        self.run_command(cli, "q")
+        mocks['cmd_stats'].assert_called_once_with(["extra"])
+        mocks['cmd_quit'].assert_called_once_with([])
+
+    def test_subcommand(self):
+        cli, mocks = self.make_cli('cmd_list_meals', 'cmd_group_start')
+        self.run_command(cli, "list Meals 2025-11-02")
+        self.run_command(cli, 'group start "Low carb" 2025-11-01:00:00')
+        mocks['cmd_list_meals'].assert_called_once_with(["2025-11-02"])
+        mocks['cmd_group_start'].assert_called_once_with(["Low carb", "2025-11-01:00:00"])
+
+    def test_subcommand_fallback_handler(self):
+        cli, mocks = self.make_cli('cmd_analyze', 'cmd_analyze_group')
+        self.run_command(cli, "analyze")
+        self.run_command(cli, "analyze --auto")
+        self.run_command(cli, "analyze group 1")
+        self.assertEqual(mocks['cmd_analyze'].call_args_list, [mock.call([]), mock.call(["--auto"])])
+        mocks['cmd_analyze_group'].assert_called_once_with(["1"])
+
+    def test_unknown_subcommand(self):
+        cli, _ = self.make_cli()
+        output = self.run_command(cli, "list nothing")
+        self.assertIn("[ERROR] Unknown list command.", output)
+
+    def test_unknown_command(self):
+        cli, _ = self.make_cli()
+        output = self.run_command(cli, "Frobnicate now")
+        self.assertIn("[ERROR] Unknown command: frobnicate.", output)
+
+    def test_unmatched_quote_and_blank_line(self):
+        cli, _ = self.make_cli()
+        self.assertIn("[ERROR] Unmatched quote in command", self.run_command(cli, 'group start "Low'))
+        self.assertEqual(self.run_command(cli, "   "), "")
+
+
+class ListMealsTest(unittest.TestCase):
+    """list meals date range filters"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        meals_path = Path(self.tmpdir.name) / 'meals.json'
+        meals_path.write_text(json.dumps({
+            "meals": [
+                {"timestamp": "2025-11-02:08:00", "gl": 23},
+                {"timestamp": "2025-11-03:09:00", "gl": 5}
+            ],
+            "groups": [],
+            "bypassed_spikes": []
+        }))
+        analyzer = SimpleNamespace(data_manager=DataManager(str(meals_path)))
+        self.cli = CLI(analyzer)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_command(self, line):
+        """Run a command and return its printed output"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.cli.process_command(line)
+        return out.getvalue()
+
+    def test_date_only_bounds(self):
+        output = self.run_command("list meals 2025-11-02 2025-11-03")
+        self.assertIn("Meals (1 total):", output)
+        self.assertIn("2025-11-02:08:00", output)
+        self.assertNotIn("2025-11-03:09:00", output)
+
+    def test_timestamp_bounds(self):
+        output = self.run_command("list meals 2025-11-02:00:00 2025-11-03:23:59")
+        self.assertIn("Meals (2 total):", output)
+
+    def test_malformed_bound(self):
+        output = self.run_command("list meals yesterday")
+        self.assertIn("[ERROR] Invalid date format", output)
+        self.assertNotIn("Meals (", output)
+
+
+class ListSpikesTest(unittest.TestCase):
+    """list spikes with an unsorted spikes_manual.json"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        spikes_path = Path(self.tmpdir.name) / 'spikes_manual.json'
+        spikes_path.write_text(json.dumps([
+            {"start": "2025-11-02T08:00:00", "end": "2025-11-02T10:00:00"},
+            {"start": "2025-11-05T08:00:00", "end": "2025-11-05T09:00:00"},
+            {"start": "2025-11-03T12:00:00", "end": "2025-11-03T13:30:00"}
+        ]))
+        analyzer = SimpleNamespace(
+            data_manager=DataManager(str(Path(self.tmpdir.name) / 'meals.json')),
+            manual_spikes_path=spikes_path
+        )
+        self.cli = CLI(analyzer)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_range_includes_spikes_after_out_of_range_entry(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.cli.process_command("list spikes 2025-11-02 2025-11-04")
+        output = out.getvalue()
+        self.assertIn("Manually Defined Spikes (2 total):", output)
+        self.assertLess(output.index("2025-11-02 08:00"), output.index("2025-11-03 12:00"))
+        self.assertNotIn("2025-11-05", output)
+
+
+
+class ReadlineSetupTest(unittest.TestCase):
+    """Interactive readline configuration"""
+
+    def test_completion_splits_on_whitespace_only(self):
+        readline = mock.MagicMock()
+        readline.read_history_file.side_effect = OSError
+        cli = CLI(SimpleNamespace(data_manager=None))
+        with mock.patch.dict('sys.modules', readline=readline):
+            self.assertIs(cli._setup_readline(), readline)
+        readline.set_completer_delims.assert_called_once_with(' \t\n')
+        readline.set_completer.assert_called_once_with(cli._complete)
+
+
+class ListMatchesTest(AnalyzerTestCase):
+    """list matches date range filters over analyzed test data"""
+
+    def setUp(self):
+        super().setUp()
+        self.meals_path.write_text(json.dumps({
+            "meals": [
+                {"timestamp": "2025-11-14:06:10", "gl": 25},
+                {"timestamp": "2025-11-14:12:10", "gl": 10}
+            ],
+            "groups": [],
+            "bypassed_spikes": []
+        }))
+        self.spikes_path.write_text(json.dumps([
+            {"start": "2025-11-14T06:25:00", "end": "2025-11-14T08:05:00"},
+            {"start": "2025-11-14T12:15:00", "end": "2025-11-14T13:50:00"}
+        ]))
+        analyzer = self.make_analyzer()
+        with redirect_stdout(io.StringIO()):
+            analyzer.run_analysis()
+        self.cli = CLI(analyzer)
+
+    def run_command(self, line):
+        """Run a command and return its printed output"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.cli.process_command(line)
+        return out.getvalue()
+
+    def test_date_only_bounds(self):
+        self.assertIn("Meal-Spike Matches (2 total):", self.run_command("list matches 2025-11-14"))
+        self.assertIn("No matched events found", self.run_command("list matches 2025-11-15"))
+
+    def test_timestamp_bounds(self):
+        output = self.run_command("list matches 2025-11-14:06:25 2025-11-14:12:00")
+        self.assertIn("Meal-Spike Matches (1 total):", output)
+        self.assertIn("2025-11-14 06:25", output)
+        self.assertNotIn("2025-11-14 12:15", output)
+
+    def test_malformed_bound(self):
+        output = self.run_command("list matches 2025-11-14 noon")
+        self.assertIn("[ERROR] Invalid date format", output)
+        self.assertNotIn("Meal-Spike Matches", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Tests for automatic spike detection"""
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from glucose_analyzer.analysis import spike_detector
+from glucose_analyzer.analysis.spike_detector import SpikeDetector
+from glucose_analyzer.utils.config import Config
+
+REPO_CONFIG = Path(__file__).parent.parent / 'config.json'
+
+NAN = float('nan')
+
+
+def synthetic_series():
+    """
+    Readings every 30 seconds, built so detection scans past SCAN_BLOCK
+
+    Returns:
+        DataFrame with 'timestamp' and 'glucose' columns
+    """
+    # Rise found 300 readings after its start, in the second scan block
+    glucose = [90.0] + [100.0] * 299
+    # Swings by 30 every two readings so the rate never flattens, across a
+    # NaN reading, and returns to baseline 350 readings after the peak
+    zigzag = [140.0, 140.0, 110.0, 110.0] * 88
+    zigzag[100] = NAN
+    glucose += zigzag[:350] + [95.0] * 10 + [NAN] + [95.0] * 4
+    # Spike interrupted by a five hour gap in the readings, ending on timeout
+    gap_at = len(glucose) + 3
+    glucose += [120.0, 150.0, 140.0] + [110.0, 110.0, 140.0, 140.0] * 3 + [95.0] * 5
+
+    timestamps = list(pd.date_range('2025-11-01', periods=gap_at, freq='30s'))
+    timestamps += list(pd.date_range(timestamps[-1] + pd.Timedelta(hours=5),
+                                     periods=len(glucose) - gap_at, freq='30s'))
+    return pd.DataFrame({'timestamp': timestamps, 'glucose': glucose})
+
+
+# (start, peak, end) reading indices and end reason from the original
+# row-by-row detector on synthetic_series()
+BASELINE_SPIKES = [
+    (0, 300, 650, "returned_to_baseline"),
+    (650, 666, 668, "timeout"),
+]
+
+
+class DetectSpikesTest(unittest.TestCase):
+    """Block-wise spike scanning against the original detector's results"""
+
+    def setUp(self):
+        self.detector = SpikeDetector(Config(str(REPO_CONFIG)))
+        self.data = synthetic_series()
+
+    def detect(self):
+        """Detect spikes and return their (start, peak, end, reason) indices"""
+        index = {ts: i for i, ts in enumerate(self.data['timestamp'])}
+        return [(index[s.start_time], index[s.peak_time], index[s.end_time], s.end_reason)
+                for s in self.detector.detect_spikes(self.data)]
+
+    def test_matches_baseline(self):
+        self.assertEqual(self.detect(), BASELINE_SPIKES)
+
+    def test_peak_values(self):
+        spikes = self.detector.detect_spikes(self.data)
+        self.assertEqual([(s.start_glucose, s.peak_glucose) for s in spikes],
+                         [(90, 140), (95, 150)])
+        self.assertEqual(self.detector.last_stats['count'], 2)
+
+    def test_result_does_not_depend_on_block_size(self):
+        for block in (1, 7, 50, 349, 351, 10_000):
+            with self.subTest(block=block), mock.patch.object(spike_detector, 'SCAN_BLOCK', block):
+                self.assertEqual(self.detect(), BASELINE_SPIKES)
+
+    def test_empty_data(self):
+        empty = pd.DataFrame({'timestamp': pd.to_datetime([]), 'glucose': []})
+        self.assertEqual(self.detector.detect_spikes(empty), [])
+        self.assertEqual(self.detector.last_stats['count'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
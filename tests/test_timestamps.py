@@ -0,0 +1,25 @@
+"""Tests for the shared timestamp parser"""
+
+import unittest
+from datetime import datetime
+
+from glucose_analyzer.utils.timestamps import parse_timestamp
+
+
+class ParseTimestampTest(unittest.TestCase):
+    """YYYY-MM-DD:HH:MM parsing"""
+
+    def test_zero_padded(self):
+        self.assertEqual(parse_timestamp("2025-11-02:08:05"), datetime(2025, 11, 2, 8, 5))
+
+    def test_unpadded_falls_back_to_strptime(self):
+        self.assertEqual(parse_timestamp("2025-1-2:8:05"), datetime(2025, 1, 2, 8, 5))
+
+    def test_invalid_raises(self):
+        for value in ("2025-11-02", "2025-11-02 08:05", "2025-02-30:08:05", "2025-11-02:24:00"):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_timestamp(value)
+
+
+if __name__ == '__main__':
+    unittest.main()